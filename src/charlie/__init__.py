@@ -1,17 +1,76 @@
-from importlib.metadata import version
+import functools
+import importlib
+import os
+from typing import Any
 
-__version__ = version("charlie-agents")
-
-from charlie.configurators import AgentConfigurator, AgentConfiguratorFactory
-from charlie.placeholder_transformer import PlaceholderTransformer
-from charlie.tracker import Tracker
-from charlie.variable_collector import VariableCollector
+_LAZY_EXPORTS = {
+    "AgentConfigurator": "charlie.configurators",
+    "AgentConfiguratorFactory": "charlie.configurators",
+    "CharlieConfig": "charlie.schema",
+    "Command": "charlie.schema",
+    "HttpMCPServer": "charlie.schema",
+    "MCPServer": "charlie.schema",
+    "PlaceholderTransformer": "charlie.placeholder_transformer",
+    "Project": "charlie.schema",
+    "Rule": "charlie.schema",
+    "Skill": "charlie.schema",
+    "StdioMCPServer": "charlie.schema",
+    "Subagent": "charlie.schema",
+    "Tracker": "charlie.tracker",
+    "VariableCollector": "charlie.variable_collector",
+    "VariableSpec": "charlie.schema",
+}
 
 __all__ = [
     "AgentConfigurator",
     "AgentConfiguratorFactory",
+    "CharlieConfig",
+    "Command",
+    "HttpMCPServer",
+    "MCPServer",
     "PlaceholderTransformer",
+    "Project",
+    "Rule",
+    "Skill",
+    "StdioMCPServer",
+    "Subagent",
     "Tracker",
     "VariableCollector",
+    "VariableSpec",
     "__version__",
 ]
+
+
+@functools.cache
+def _get_version() -> str:
+    try:
+        from charlie._version import __version__ as version
+    except ImportError:
+        from importlib.metadata import version as metadata_version
+
+        return metadata_version("charlie-agents")
+
+    return version
+
+
+def __getattr__(name: str) -> Any:
+    if name == "__version__":
+        return _get_version()
+
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(__all__)
+
+
+if os.environ.get("CHARLIE_EAGER_IMPORT"):
+    for _name in _LAZY_EXPORTS:
+        __getattr__(_name)
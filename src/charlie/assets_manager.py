@@ -1,6 +1,7 @@
 import shutil
 from pathlib import Path
 
+from charlie.filesystem import ensure_directory
 from charlie.tracker import Tracker
 
 ASSETS_DIR_MARKER = (".charlie", "assets")
@@ -37,6 +38,6 @@ class AssetsManager:
             asset_path = Path(asset)
             relative_path = self._extract_relative_path(asset_path)
             destination = destination_base / relative_path
-            destination.parent.mkdir(parents=True, exist_ok=True)
+            ensure_directory(destination.parent)
             shutil.copy2(asset, destination)
             self.tracker.track(f"Created {destination}")
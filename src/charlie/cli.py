@@ -10,8 +10,6 @@ from charlie.placeholder_transformer import PlaceholderTransformer
 from charlie.tracker import Tracker
 from charlie.variable_collector import VariableCollector
 
-_SUPPORTED_AGENTS = ["claude", "cursor", "copilot", "opencode"]
-
 app = typer.Typer(
     name="charlie",
     help="Universal Agent Config Generator",
@@ -61,7 +59,7 @@ def generate(
 
         console.print(f"[cyan]Using configuration:[/cyan] {resolved_config_file}")
 
-        charlie_config = parse_config(str(resolved_config_file))
+        charlie_config = parse_config(resolved_config_file)
 
         tracker = Tracker()
         configurator = AgentConfiguratorFactory.create(
@@ -115,13 +113,11 @@ def generate(
         raise typer.Exit(1)
     except ConfigParseError as e:
         console.print(f"[red]Configuration Error:[/red]\n{e}")
-        # pint(e)
         raise typer.Exit(1)
     except ValueError as e:
         console.print(f"[red]Error:[/red] {e}")
         raise typer.Exit(1)
     except Exception as e:
-        print(e)
         console.print(f"[red]Unexpected Error:[/red] {e}")
         if verbose_output:
             import traceback
@@ -164,10 +160,11 @@ def validate(
 def list_agents() -> None:
     console.print("\n[bold]Supported AI Agents:[/bold]\n")
 
-    for agent_name in sorted(_SUPPORTED_AGENTS):
+    supported_agents = AgentConfiguratorFactory.supported_agents()
+    for agent_name in supported_agents:
         console.print(f"  • {agent_name}")
 
-    console.print(f"\n[dim]Total: {len(_SUPPORTED_AGENTS)} agents[/dim]\n")
+    console.print(f"\n[dim]Total: {len(supported_agents)} agents[/dim]\n")
 
 
 def main() -> None:
@@ -11,7 +11,7 @@ console = Console()
 T = TypeVar("T", bound=BaseModel)
 
 
-@dataclass
+@dataclass(slots=True)
 class MergeResult:
     config: CharlieConfig
     warnings: list[str] = field(default_factory=list)
@@ -1,12 +1,15 @@
+import functools
+import os
+import re
+import stat
 from pathlib import Path
 from typing import Any, TypeVar, get_origin
 
-import yaml
 from pydantic import BaseModel, TypeAdapter, ValidationError
 from rich.console import Console
-from slugify import slugify
 
 from charlie.config_merger import merge_configs
+from charlie.filesystem import read_bytes
 from charlie.repository_fetcher import RepositoryFetchError, fetch_repository
 from charlie.schema import (
     CharlieConfig,
@@ -22,11 +25,47 @@ console = Console()
 
 T = TypeVar("T", bound=BaseModel)
 
+_LEADING_WHITESPACE_RE = re.compile(r"\s*")
+
+_MAIN_CONFIG_FILENAMES = ("charlie.yaml", "charlie.dist.yaml")
+_CONFIG_LOOKUP_NAMES = frozenset((*_MAIN_CONFIG_FILENAMES, ".charlie"))
+_YAML_SUFFIXES = (".yaml", ".yml")
+
+_KNOWN_MARKDOWN_FIELDS = frozenset({"name", "description", "prompt", "metadata", "replacements"})
+_MARKDOWN_MODELS: frozenset[type[BaseModel]] = frozenset((Command, Rule, Subagent, Skill))
+
+_PARALLEL_PARSE_THRESHOLD = 8
+_MAX_PARSE_WORKERS = 32
+
 
 class ConfigParseError(Exception):
     pass
 
 
+def _slugify(text: str) -> str:
+    from slugify import slugify
+
+    return slugify(text)
+
+
+@functools.cache
+def _yaml_loader() -> Any:
+    import yaml
+
+    # libyaml's loader builds the same objects as the pure-Python one, much faster
+    return getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def _load_yaml(stream: Any) -> Any:
+    import yaml
+
+    return yaml.load(stream, Loader=_yaml_loader())
+
+
+def _format_validation_error(error: ValidationError) -> str:
+    return "\n".join("  " + " -> ".join(map(str, detail["loc"])) + ": " + detail["msg"] for detail in error.errors())
+
+
 def _infer_project_name(base_dir: Path) -> str:
     return base_dir.resolve().name
 
@@ -92,23 +131,26 @@ def _resolve_extends(extends_urls: list[str], visited: set[str] | None = None) -
 
 
 def parse_frontmatter(content: str) -> tuple[dict, str]:
-    stripped_content = content.lstrip()
+    import yaml
 
-    if not stripped_content.startswith("---"):
-        return {}, stripped_content
+    leading_whitespace = _LEADING_WHITESPACE_RE.match(content)
+    start = leading_whitespace.end() if leading_whitespace else 0
+
+    if not content.startswith("---", start):
+        return {}, content[start:]
 
     try:
-        content_parts = stripped_content.split("---", 2)
-        if len(content_parts) < 3:
+        closing_delimiter = content.find("---", start + 3)
+        if closing_delimiter == -1:
             raise ConfigParseError("Frontmatter closing delimiter '---' not found")
 
-        frontmatter_text = content_parts[1].strip()
-        content_body = content_parts[2].lstrip()
+        frontmatter_text = content[start + 3 : closing_delimiter].strip()
+        content_body = content[closing_delimiter + 3 :].lstrip()
 
         if not frontmatter_text:
             return {}, content_body
 
-        parsed_frontmatter = yaml.safe_load(frontmatter_text)
+        parsed_frontmatter = _load_yaml(frontmatter_text)
         if parsed_frontmatter is None:
             parsed_frontmatter = {}
 
@@ -121,33 +163,38 @@ def parse_frontmatter(content: str) -> tuple[dict, str]:
 
 
 def parse_config(config_path: str | Path, _visited: set[str] | None = None) -> CharlieConfig:
-    resolved_config_path = Path(config_path)
+    import yaml
+
+    resolved_config_path = config_path if isinstance(config_path, Path) else Path(config_path)
+
+    try:
+        config_path_mode: int | None = os.stat(resolved_config_path).st_mode
+    except OSError:
+        config_path_mode = None
+    is_config_file = config_path_mode is not None and stat.S_ISREG(config_path_mode)
+    is_config_dir = config_path_mode is not None and stat.S_ISDIR(config_path_mode)
 
-    if resolved_config_path.is_file():
+    if is_config_file:
         base_directory = resolved_config_path.parent
-    elif resolved_config_path.is_dir():
+    elif is_config_dir:
         if resolved_config_path.name == ".charlie":
             base_directory = resolved_config_path.parent
         else:
             base_directory = resolved_config_path
-    elif resolved_config_path.suffix in [".yaml", ".yml"]:
+    elif resolved_config_path.suffix in _YAML_SUFFIXES:
         base_directory = resolved_config_path.parent
     else:
         base_directory = resolved_config_path
 
-    charlie_config_dir = base_directory / ".charlie"
-    if charlie_config_dir.exists() and charlie_config_dir.is_dir():
+    if (base_directory / ".charlie").is_dir():
         return load_directory_config(base_directory, _visited=_visited)
 
-    if resolved_config_path.is_dir():
-        return _create_default_config(base_directory)
-
-    if not resolved_config_path.exists():
+    if is_config_dir or config_path_mode is None:
         return _create_default_config(base_directory)
 
     try:
-        with open(resolved_config_path, encoding="utf-8") as f:
-            raw_config_data = yaml.safe_load(f)
+        with open(resolved_config_path, "rb") as f:
+            raw_config_data = _load_yaml(f)
     except yaml.YAMLError as e:
         raise ConfigParseError(f"Invalid YAML syntax: {e}")
     except Exception as e:
@@ -168,19 +215,19 @@ def parse_config(config_path: str | Path, _visited: set[str] | None = None) -> C
 
     for command in raw_config_data.get("commands") or []:
         if "name" not in command and "description" in command:
-            command["name"] = slugify(command["description"])
+            command["name"] = _slugify(command["description"])
 
     for rule in raw_config_data.get("rules") or []:
         if "name" not in rule and "description" in rule:
-            rule["name"] = slugify(rule["description"])
+            rule["name"] = _slugify(rule["description"])
 
     for subagent in raw_config_data.get("subagents") or []:
         if "name" not in subagent and "description" in subagent:
-            subagent["name"] = slugify(subagent["description"])
+            subagent["name"] = _slugify(subagent["description"])
 
     for skill in raw_config_data.get("skills") or []:
         if "name" not in skill and "description" in skill:
-            skill["name"] = slugify(skill["description"])
+            skill["name"] = _slugify(skill["description"])
 
     raw_config_data["variables"] = raw_config_data.get("variables") or {}
 
@@ -199,14 +246,10 @@ def parse_config(config_path: str | Path, _visited: set[str] | None = None) -> C
         raw_config_data["ignore_patterns"] = unique_patterns
 
     try:
-        parsed_config = CharlieConfig(**raw_config_data)
+        parsed_config = CharlieConfig.model_validate(raw_config_data)
         parsed_config = _ensure_project_name(parsed_config, base_directory)
     except ValidationError as e:
-        validation_errors = []
-        for error in e.errors():
-            error_location = " -> ".join(str(x) for x in error["loc"])
-            validation_errors.append(f"  {error_location}: {error['msg']}")
-        raise ConfigParseError("Configuration validation failed:\n" + "\n".join(validation_errors))
+        raise ConfigParseError(f"Configuration validation failed:\n{_format_validation_error(e)}") from e
 
     if base_config is not None:
         result = merge_configs(base_config, parsed_config, source_name=str(resolved_config_path))
@@ -218,142 +261,139 @@ def parse_config(config_path: str | Path, _visited: set[str] | None = None) -> C
 
 
 def find_config_file(start_dir: str | Path = ".") -> Path | None:
-    resolved_start_dir = Path(start_dir).resolve()
-
-    main_config_file = resolved_start_dir / "charlie.yaml"
-    if main_config_file.exists():
-        return main_config_file
+    # One directory listing answers all three lookups instead of a stat per candidate
+    try:
+        with os.scandir(start_dir) as entries:
+            candidates = {entry.name: entry for entry in entries if entry.name in _CONFIG_LOOKUP_NAMES}
+    except OSError:
+        return None
 
-    dist_config_file = resolved_start_dir / "charlie.dist.yaml"
-    if dist_config_file.exists():
-        return dist_config_file
+    found_name = None
+    for filename in _MAIN_CONFIG_FILENAMES:
+        entry = candidates.get(filename)
+        if entry is not None and (entry.is_file() or entry.is_dir()):
+            found_name = filename
+            break
+    else:
+        config_directory = candidates.get(".charlie")
+        if config_directory is not None and config_directory.is_dir():
+            found_name = ".charlie"
 
-    config_directory = resolved_start_dir / ".charlie"
-    if config_directory.exists() and config_directory.is_dir():
-        return config_directory
+    if found_name is None:
+        return None
 
-    return None
+    # Resolving walks every path component, so it only runs once a config was found
+    return Path(start_dir).resolve() / found_name
 
 
 def parse_single_file(file_path: Path, model_class: type[T]) -> T:
+    if file_path.suffix == ".md":
+        raw_data = _read_markdown_data(file_path, model_class)
+    else:
+        raw_data = _read_yaml_data(file_path, model_class)
+
+    try:
+        if get_origin(model_class) is None:
+            return model_class.model_validate(raw_data)
+
+        validated: T = _type_adapter(model_class).validate_python(raw_data)
+
+        return validated
+    except ValidationError as e:
+        raise ConfigParseError(f"Validation failed for {file_path}:\n{_format_validation_error(e)}") from e
+
+
+@functools.cache
+def _type_adapter(model_class: Any) -> TypeAdapter[Any]:
+    return TypeAdapter(model_class)
+
+
+def _parse_file_groups(groups: list[tuple[list[Path], Any, str]]) -> list[list[Any]]:
+    jobs = [(file_path, model_class, kind) for file_paths, model_class, kind in groups for file_path in file_paths]
+
+    # Thread start-up costs more than parsing a handful of small files
+    if len(jobs) < _PARALLEL_PARSE_THRESHOLD:
+        results = [_parse_file(*job) for job in jobs]
+    else:
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=min(_MAX_PARSE_WORKERS, len(jobs))) as executor:
+            results = list(executor.map(lambda job: _parse_file(*job), jobs))
+
+    grouped_results: list[list[Any]] = []
+    offset = 0
+    for file_paths, _, _ in groups:
+        grouped_results.append(results[offset : offset + len(file_paths)])
+        offset += len(file_paths)
+
+    return grouped_results
+
+
+def _parse_file(file_path: Path, model_class: type[T], kind: str) -> T:
     try:
-        with open(file_path, encoding="utf-8") as f:
-            file_content = f.read()
+        return parse_single_file(file_path, model_class)
+    except ConfigParseError as e:
+        raise ConfigParseError(f"Error loading {kind} from {file_path}: {e}")
+
+
+def _read_markdown_data(file_path: Path, model_class: type[T]) -> Any:
+    try:
+        file_content = file_path.read_text(encoding="utf-8")
     except Exception as e:
         raise ConfigParseError(f"Error reading {file_path}: {e}")
 
     if not file_content.strip():
         raise ConfigParseError(f"File is empty: {file_path}")
 
-    if file_path.suffix == ".md":
-        try:
-            parsed_frontmatter, content_body = parse_frontmatter(file_content)
-        except ConfigParseError as e:
-            raise ConfigParseError(f"Error parsing frontmatter in {file_path}: {e}")
-
-        if model_class.__name__ == "Command":
-            name = parsed_frontmatter.get("name")
-            if name is None:
-                name = slugify(file_path.stem)
-
-            known_fields = {"name", "description", "prompt", "metadata", "replacements"}
-            metadata = {k: v for k, v in parsed_frontmatter.items() if k not in known_fields}
-
-            raw_data = {
-                "name": name,
-                "description": parsed_frontmatter.get("description", ""),
-                "prompt": content_body.strip(),
-                "metadata": {**parsed_frontmatter.get("metadata", {}), **metadata},
-            }
-
-            if "replacements" in parsed_frontmatter:
-                raw_data["replacements"] = parsed_frontmatter["replacements"]
-
-        elif model_class.__name__ == "Rule":
-            name = parsed_frontmatter.get("name")
-            if name is None:
-                name = slugify(file_path.stem)
-
-            known_fields = {"name", "description", "prompt", "metadata", "replacements"}
-            metadata = {k: v for k, v in parsed_frontmatter.items() if k not in known_fields}
-
-            raw_data = {
-                "name": name,
-                "description": parsed_frontmatter.get("description", ""),
-                "prompt": content_body.strip(),
-                "metadata": {**parsed_frontmatter.get("metadata", {}), **metadata},
-            }
-
-            if "replacements" in parsed_frontmatter:
-                raw_data["replacements"] = parsed_frontmatter["replacements"]
-
-        elif model_class.__name__ == "Subagent":
-            name = parsed_frontmatter.get("name")
-            if name is None:
-                name = slugify(file_path.stem)
-
-            known_fields = {"name", "description", "prompt", "metadata", "replacements"}
-            metadata = {k: v for k, v in parsed_frontmatter.items() if k not in known_fields}
-
-            raw_data = {
-                "name": name,
-                "description": parsed_frontmatter.get("description", ""),
-                "prompt": content_body.strip(),
-                "metadata": {**parsed_frontmatter.get("metadata", {}), **metadata},
-            }
-
-            if "replacements" in parsed_frontmatter:
-                raw_data["replacements"] = parsed_frontmatter["replacements"]
-
-        elif model_class.__name__ == "Skill":
-            name = parsed_frontmatter.get("name")
-            if name is None:
-                if file_path.name == "SKILL.md":
-                    name = slugify(file_path.parent.name)
-                else:
-                    name = slugify(file_path.stem)
-
-            known_fields = {"name", "description", "prompt", "metadata", "replacements"}
-            metadata = {k: v for k, v in parsed_frontmatter.items() if k not in known_fields}
-
-            raw_data = {
-                "name": name,
-                "description": parsed_frontmatter.get("description", ""),
-                "prompt": content_body.strip(),
-                "metadata": {**parsed_frontmatter.get("metadata", {}), **metadata},
-            }
-
-            if "replacements" in parsed_frontmatter:
-                raw_data["replacements"] = parsed_frontmatter["replacements"]
+    try:
+        parsed_frontmatter, content_body = parse_frontmatter(file_content)
+    except ConfigParseError as e:
+        raise ConfigParseError(f"Error parsing frontmatter in {file_path}: {e}")
+
+    if model_class in _MARKDOWN_MODELS:
+        name = parsed_frontmatter.get("name")
+        if name is None:
+            if model_class is Skill and file_path.name == "SKILL.md":
+                name = _slugify(file_path.parent.name)
+            else:
+                name = _slugify(file_path.stem)
+
+        metadata = {k: v for k, v in parsed_frontmatter.items() if k not in _KNOWN_MARKDOWN_FIELDS}
+
+        raw_data = {
+            "name": name,
+            "description": parsed_frontmatter.get("description", ""),
+            "prompt": content_body.strip(),
+            "metadata": {**parsed_frontmatter.get("metadata", {}), **metadata},
+        }
+
+        if "replacements" in parsed_frontmatter:
+            raw_data["replacements"] = parsed_frontmatter["replacements"]
 
-        else:
-            raw_data = parsed_frontmatter
     else:
-        try:
-            raw_data = yaml.safe_load(file_content)
-        except yaml.YAMLError as e:
-            raise ConfigParseError(f"Invalid YAML in {file_path}: {e}")
+        raw_data = parsed_frontmatter
 
-        if not raw_data:
-            raise ConfigParseError(f"File is empty: {file_path}")
+    return raw_data
 
-        if str(model_class).find("MCPServer") != -1:
-            if "name" not in raw_data:
-                raw_data["name"] = slugify(file_path.stem)
+
+def _read_yaml_data(file_path: Path, model_class: type[T]) -> Any:
+    import yaml
 
     try:
-        if get_origin(model_class) is None:
-            return model_class(**raw_data)
+        raw_data = _load_yaml(read_bytes(file_path))
+    except yaml.YAMLError as e:
+        raise ConfigParseError(f"Invalid YAML in {file_path}: {e}")
+    except Exception as e:
+        raise ConfigParseError(f"Error reading {file_path}: {e}")
+
+    if not raw_data:
+        raise ConfigParseError(f"File is empty: {file_path}")
 
-        adapter = TypeAdapter(model_class)
+    if str(model_class).find("MCPServer") != -1:
+        if "name" not in raw_data:
+            raw_data["name"] = _slugify(file_path.stem)
 
-        return adapter.validate_python(raw_data)
-    except ValidationError as e:
-        validation_errors = []
-        for error in e.errors():
-            error_location = " -> ".join(str(x) for x in error["loc"])
-            validation_errors.append(f"  {error_location}: {error['msg']}")
-        raise ConfigParseError(f"Validation failed for {file_path}:\n" + "\n".join(validation_errors))
+    return raw_data
 
 
 def discover_charlie_files(base_dir: Path) -> dict[str, list[Path]]:
@@ -371,38 +411,57 @@ def discover_charlie_files(base_dir: Path) -> dict[str, list[Path]]:
     if not charlie_config_directory.exists():
         return discovered_files
 
-    commands_directory = charlie_config_directory / "commands"
-    if commands_directory.exists():
-        discovered_files["commands"] = sorted(commands_directory.glob("*.md"))
-
-    rules_directory = charlie_config_directory / "rules"
-    if rules_directory.exists():
-        discovered_files["rules"] = sorted(rules_directory.glob("*.md"))
-
-    agents_directory = charlie_config_directory / "agents"
-    if agents_directory.exists():
-        discovered_files["subagents"] = sorted(agents_directory.glob("*.md"))
+    discovered_files["commands"] = _list_files(charlie_config_directory / "commands", ".md")
+    discovered_files["rules"] = _list_files(charlie_config_directory / "rules", ".md")
+    discovered_files["subagents"] = _list_files(charlie_config_directory / "agents", ".md")
 
     skills_directory = charlie_config_directory / "skills"
-    if skills_directory.exists():
-        discovered_files["skills"] = sorted(skills_directory.glob("*.md"))
-        for skill_dir in sorted(skills_directory.iterdir()):
-            if skill_dir.is_dir():
-                skill_md = skill_dir / "SKILL.md"
-                if skill_md.exists():
-                    discovered_files["skills"].append(skill_md)
-
-    mcp_servers_directory = charlie_config_directory / "mcp-servers"
-    if mcp_servers_directory.exists():
-        discovered_files["mcp_servers"] = sorted(mcp_servers_directory.glob("*.yaml"))
+    discovered_files["skills"] = _list_files(skills_directory, ".md")
+    discovered_files["skills"].extend(_list_skill_files(skills_directory))
+
+    discovered_files["mcp_servers"] = _list_files(charlie_config_directory / "mcp-servers", _YAML_SUFFIXES)
 
     assets_directory = charlie_config_directory / "assets"
-    if assets_directory.exists():
-        discovered_files["assets"] = sorted(assets_directory.rglob("*.*"))
+    if assets_directory.is_dir():
+        discovered_files["assets"] = sorted(path for path in _collect_files(assets_directory) if "." in path.name)
 
     return discovered_files
 
 
+def _list_files(directory: Path, suffix: str | tuple[str, ...]) -> list[Path]:
+    try:
+        with os.scandir(directory) as entries:
+            names = [entry.name for entry in entries if entry.name.endswith(suffix) and entry.is_file()]
+    except (FileNotFoundError, NotADirectoryError):
+        return []
+
+    return [directory / name for name in sorted(names)]
+
+
+def _list_skill_files(skills_directory: Path) -> list[Path]:
+    try:
+        with os.scandir(skills_directory) as entries:
+            names = [entry.name for entry in entries if entry.is_dir()]
+    except (FileNotFoundError, NotADirectoryError):
+        return []
+
+    skill_files = [skills_directory / name / "SKILL.md" for name in sorted(names)]
+
+    return [skill_file for skill_file in skill_files if skill_file.exists()]
+
+
+def _collect_files(directory: Path) -> list[Path]:
+    files: list[Path] = []
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                files.extend(_collect_files(Path(entry.path)))
+            elif entry.is_file():
+                files.append(Path(entry.path))
+
+    return files
+
+
 def read_ignore_patterns(base_dir: Path) -> list[str]:
     charlieignore_file = base_dir / ".charlieignore"
 
@@ -424,26 +483,28 @@ def read_ignore_patterns(base_dir: Path) -> list[str]:
         raise ConfigParseError(f"Error reading {charlieignore_file}: {e}")
 
 
+def _main_config_file(base_dir: Path) -> Path | None:
+    for filename in _MAIN_CONFIG_FILENAMES:
+        config_file = base_dir / filename
+        if config_file.exists():
+            return config_file
+
+    return None
+
+
 def load_directory_config(base_dir: Path, _visited: set[str] | None = None) -> CharlieConfig:
     default_project = {"name": base_dir.stem, "dir": str(base_dir)}
     merged_config_data: dict[str, Any] = {
         "version": "1.0",
         "project": default_project,
-        "commands": [],
-        "rules": [],
-        "subagents": [],
-        "skills": [],
-        "mcp_servers": [],
     }
 
     extends_urls: list[str] = []
-    main_config_file_path = base_dir / "charlie.yaml"
-    main_config_file_path_dist = base_dir / "charlie.dist.yaml"
-    if main_config_file_path.exists() or main_config_file_path_dist.exists():
+    chosen_config_file = _main_config_file(base_dir)
+    if chosen_config_file is not None:
         try:
-            chosen_config_file = main_config_file_path if main_config_file_path.exists() else main_config_file_path_dist
-            with open(chosen_config_file, encoding="utf-8") as f:
-                main_config_content = yaml.safe_load(f)
+            with open(chosen_config_file, "rb") as f:
+                main_config_content = _load_yaml(f)
                 if main_config_content:
                     if "extends" in main_config_content:
                         extends_urls = main_config_content["extends"] or []
@@ -462,50 +523,39 @@ def load_directory_config(base_dir: Path, _visited: set[str] | None = None) -> C
 
     discovered_config_files = discover_charlie_files(base_dir)
 
-    for command_file_path in discovered_config_files["commands"]:
-        try:
-            parsed_command = parse_single_file(command_file_path, Command)
-            merged_config_data["commands"].append(parsed_command.model_dump())
-        except ConfigParseError as e:
-            raise ConfigParseError(f"Error loading command from {command_file_path}: {e}")
-
-    for rules_file_path in discovered_config_files["rules"]:
-        try:
-            parsed_rule = parse_single_file(rules_file_path, Rule)
-            if not parsed_rule.name:
-                parsed_rule.name = slugify(Path(rules_file_path).stem)
-            merged_config_data["rules"].append(parsed_rule)
-        except ConfigParseError as e:
-            raise ConfigParseError(f"Error loading rule from {rules_file_path}: {e}")
-
-    for subagent_file_path in discovered_config_files["subagents"]:
-        try:
-            parsed_subagent = parse_single_file(subagent_file_path, Subagent)
-            merged_config_data["subagents"].append(parsed_subagent.model_dump())
-        except ConfigParseError as e:
-            raise ConfigParseError(f"Error loading subagent from {subagent_file_path}: {e}")
+    commands, rules, subagents, skills, mcp_servers = _parse_file_groups(
+        [
+            (discovered_config_files["commands"], Command, "command"),
+            (discovered_config_files["rules"], Rule, "rule"),
+            (discovered_config_files["subagents"], Subagent, "subagent"),
+            (discovered_config_files["skills"], Skill, "skill"),
+            (discovered_config_files["mcp_servers"], MCPServer, "MCP server"),
+        ]
+    )
 
-    for skill_file_path in discovered_config_files["skills"]:
-        try:
-            parsed_skill = parse_single_file(skill_file_path, Skill)
-            skill_data = parsed_skill.model_dump()
-            if skill_file_path.name == "SKILL.md":
-                skill_source_dir = skill_file_path.parent
-                extra_files = {}
-                for extra in sorted(skill_source_dir.rglob("*")):
-                    if extra.is_file() and extra != skill_file_path:
-                        extra_files[extra.relative_to(skill_source_dir).as_posix()] = str(extra)
-                skill_data["files"] = extra_files
-            merged_config_data["skills"].append(skill_data)
-        except ConfigParseError as e:
-            raise ConfigParseError(f"Error loading skill from {skill_file_path}: {e}")
-
-    for mcp_server_file_path in discovered_config_files["mcp_servers"]:
-        try:
-            mcp_server_config: MCPServer = parse_single_file(mcp_server_file_path, MCPServer)  # type: ignore[arg-type]
-            merged_config_data["mcp_servers"].append(mcp_server_config.model_dump())
-        except ConfigParseError as e:
-            raise ConfigParseError(f"Error loading MCP server from {mcp_server_file_path}: {e}")
+    for rules_file_path, parsed_rule in zip(discovered_config_files["rules"], rules, strict=True):
+        if not parsed_rule.name:
+            parsed_rule.name = _slugify(rules_file_path.stem)
+
+    for skill_file_path, parsed_skill in zip(discovered_config_files["skills"], skills, strict=True):
+        if skill_file_path.name == "SKILL.md":
+            skill_source_dir = skill_file_path.parent
+            extra_files = {}
+            for extra in sorted(_collect_files(skill_source_dir)):
+                if extra != skill_file_path:
+                    extra_files[extra.relative_to(skill_source_dir).as_posix()] = str(extra)
+            parsed_skill.files = extra_files
+
+    # Empty categories are left to the model's default factories
+    for key, values in (
+        ("commands", commands),
+        ("rules", rules),
+        ("subagents", subagents),
+        ("skills", skills),
+        ("mcp_servers", mcp_servers),
+    ):
+        if values:
+            merged_config_data[key] = values
 
     merged_config_data["project"] = {**default_project, **merged_config_data["project"]}
     merged_config_data["assets"] = [str(value) for value in discovered_config_files["assets"]]
@@ -525,14 +575,10 @@ def load_directory_config(base_dir: Path, _visited: set[str] | None = None) -> C
         merged_config_data["ignore_patterns"] = unique_patterns
 
     try:
-        final_config = CharlieConfig(**merged_config_data)
+        final_config = CharlieConfig.model_validate(merged_config_data)
         final_config = _ensure_project_name(final_config, base_dir)
     except ValidationError as e:
-        validation_errors = []
-        for error in e.errors():
-            error_location = " -> ".join(str(x) for x in error["loc"])
-            validation_errors.append(f"  {error_location}: {error['msg']}")
-        raise ConfigParseError("Configuration validation failed:\n" + "\n".join(validation_errors))
+        raise ConfigParseError(f"Configuration validation failed:\n{_format_validation_error(e)}") from e
 
     if base_config is not None:
         result = merge_configs(base_config, final_config, source_name=str(base_dir))
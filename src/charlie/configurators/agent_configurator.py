@@ -1,7 +1,9 @@
 from abc import ABC, abstractmethod
+from pathlib import Path
 
 from charlie.enums import RuleMode
 from charlie.schema import Command, MCPServer, Rule, Skill, Subagent
+from charlie.tracker import Tracker
 
 
 class AgentConfigurator(ABC):
@@ -36,3 +38,15 @@ class AgentConfigurator(ABC):
     @abstractmethod
     def ignore_file(self, patterns: list[str]) -> None:
         pass
+
+
+def namespace_prefix(namespace: str | None, separator: str = "-") -> str:
+    if namespace is None:
+        return ""
+
+    return f"{namespace}{separator}"
+
+
+def track_file(tracker: Tracker, file: Path, written: bool) -> None:
+    # Files whose content is already up to date are left untouched, so they are not reported as created
+    tracker.track(f"Created {file}" if written else f"Unchanged {file}")
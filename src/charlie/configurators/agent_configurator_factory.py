@@ -1,38 +1,79 @@
+from collections.abc import Callable
+
 from charlie.assets_manager import AssetsManager
 from charlie.configurators.agent_configurator import AgentConfigurator
-from charlie.configurators.claude_configurator import ClaudeConfigurator
-from charlie.configurators.copilot_configurator import CopilotConfigurator
-from charlie.configurators.cursor_configurator import CursorConfigurator
-from charlie.configurators.opencode_configurator import OpencodeConfigurator
 from charlie.markdown_generator import MarkdownGenerator
 from charlie.mcp_server_generator import MCPServerGenerator
 from charlie.schema import Project
 from charlie.tracker import Tracker
 
 
-class AgentConfiguratorFactory:
-    @staticmethod
-    def create(agent_name: str, project: Project, tracker: Tracker) -> AgentConfigurator:
-        markdown_generator = MarkdownGenerator()
-        mcp_server_generator = MCPServerGenerator(tracker)
-        assets_manager = AssetsManager(tracker)
+def _create_claude(project: Project, tracker: Tracker, agent_name: str) -> AgentConfigurator:
+    from charlie.configurators.claude_configurator import ClaudeConfigurator
+
+    return ClaudeConfigurator(
+        project, tracker, MarkdownGenerator(), MCPServerGenerator(tracker), AssetsManager(tracker), agent_name
+    )
+
+
+def _create_copilot(project: Project, tracker: Tracker, agent_name: str) -> AgentConfigurator:
+    from charlie.configurators.copilot_configurator import CopilotConfigurator
+
+    return CopilotConfigurator(project, tracker, MarkdownGenerator(), AssetsManager(tracker), agent_name)
+
+
+def _create_cursor(project: Project, tracker: Tracker, agent_name: str) -> AgentConfigurator:
+    from charlie.configurators.cursor_configurator import CursorConfigurator
+
+    return CursorConfigurator(
+        project, tracker, MarkdownGenerator(), MCPServerGenerator(tracker), AssetsManager(tracker), agent_name
+    )
+
+
+def _create_opencode(project: Project, tracker: Tracker, agent_name: str) -> AgentConfigurator:
+    from charlie.configurators.opencode_configurator import OpencodeConfigurator
+
+    return OpencodeConfigurator(project, tracker, MarkdownGenerator(), None, AssetsManager(tracker), agent_name)
 
-        if agent_name == "cursor":
-            return CursorConfigurator(
-                project, tracker, markdown_generator, mcp_server_generator, assets_manager, agent_name
-            )
 
-        if agent_name == "claude":
-            return ClaudeConfigurator(
-                project, tracker, markdown_generator, mcp_server_generator, assets_manager, agent_name
-            )
+_CONFIGURATORS: dict[str, Callable[[Project, Tracker, str], AgentConfigurator]] = {
+    "claude": _create_claude,
+    "copilot": _create_copilot,
+    "cursor": _create_cursor,
+    "opencode": _create_opencode,
+}
 
-        if agent_name == "copilot":
-            return CopilotConfigurator(project, tracker, markdown_generator, assets_manager, agent_name)
+_AGENT_ALIASES: dict[str, str] = {
+    **{name: name for name in _CONFIGURATORS},
+    "claudecode": "claude",
+    "githubcopilot": "copilot",
+}
 
-        if agent_name == "opencode":
-            return OpencodeConfigurator(
-                project, tracker, markdown_generator, None, assets_manager, agent_name
-            )
+_FACTORIES: dict[str, tuple[str, Callable[[Project, Tracker, str], AgentConfigurator]]] = {
+    alias: (short_name, _CONFIGURATORS[short_name]) for alias, short_name in _AGENT_ALIASES.items()
+}
+
+
+_AGENT_NAME_SEPARATORS = str.maketrans("", "", " -_")
+
+
+def _normalize_agent_name(agent_name: str) -> str:
+    return agent_name.lower().translate(_AGENT_NAME_SEPARATORS)
+
+
+_SUPPORTED_AGENTS = tuple(sorted(_CONFIGURATORS))
+
+
+class AgentConfiguratorFactory:
+    @staticmethod
+    def supported_agents() -> tuple[str, ...]:
+        return _SUPPORTED_AGENTS
+
+    @staticmethod
+    def create(agent_name: str, project: Project, tracker: Tracker) -> AgentConfigurator:
+        factory = _FACTORIES.get(_normalize_agent_name(agent_name))
+        if factory is None:
+            raise ValueError(f"Unsupported agent: {agent_name}")
 
-        raise ValueError(f"Unsupported agent: {agent_name}")
+        short_name, create_configurator = factory
+        return create_configurator(project, tracker, short_name)
@@ -4,8 +4,9 @@ from pathlib import Path
 from typing import Any, final
 
 from charlie.assets_manager import AssetsManager
-from charlie.configurators.agent_configurator import AgentConfigurator
+from charlie.configurators.agent_configurator import AgentConfigurator, namespace_prefix, track_file
 from charlie.enums import RuleMode
+from charlie.filesystem import ensure_directory, read_json, write_json
 from charlie.markdown_generator import MarkdownGenerator
 from charlie.mcp_server_generator import MCPServerGenerator
 from charlie.schema import Command, MCPServer, Project, Rule, Skill, Subagent
@@ -62,6 +63,7 @@ class ClaudeConfigurator(AgentConfigurator):
         short_name: str,
     ):
         self.project = project
+        self.__project_dir = Path(project.dir)
         self.tracker = tracker
         self.markdown_generator = markdown_generator
         self.mcp_server_generator = mcp_server_generator
@@ -84,9 +86,12 @@ class ClaudeConfigurator(AgentConfigurator):
         }
 
     def commands(self, commands: list[Command]) -> None:
+        skills_dir = self.__project_dir / self.SKILLS_DIR
+        prefix = namespace_prefix(self.project.namespace)
         for command in commands:
             self.__write_skill(
-                name=command.name,
+                skills_dir=skills_dir,
+                name=f"{prefix}{command.name}",
                 description=command.description,
                 prompt=command.prompt,
                 metadata=command.metadata,
@@ -96,32 +101,29 @@ class ClaudeConfigurator(AgentConfigurator):
         if not rules:
             return
 
-        rules_file = Path(self.project.dir) / self.RULES_FILE
-        rules_file.parent.mkdir(parents=True, exist_ok=True)
+        rules_file = self.__project_dir / self.RULES_FILE
+        ensure_directory(rules_file.parent)
 
         if mode == RuleMode.MERGED:
-            body = f"# {self.project.name}\n\n"
+            parts = [f"# {self.project.name}\n\n"]
 
             for rule in rules:
-                body += f"## {rule.description}\n\n"
-                body += f"{rule.prompt}\n\n"
+                parts.append(f"## {rule.description}\n\n{rule.prompt}\n\n")
 
-            self.markdown_generator.generate(file=rules_file, body=body.rstrip())
-            self.tracker.track(f"Created {rules_file}")
+            written = self.markdown_generator.generate(file=rules_file, body="".join(parts).rstrip())
+            track_file(self.tracker, rules_file, written)
             return
 
-        rules_dir = Path(self.project.dir) / self.RULES_DIR
-        rules_dir.mkdir(parents=True, exist_ok=True)
+        rules_dir = self.__project_dir / self.RULES_DIR
+        ensure_directory(rules_dir)
 
-        body = f"# {self.project.name}\n\n"
+        parts = [f"# {self.project.name}\n\n"]
 
+        prefix = namespace_prefix(self.project.namespace)
         for rule in rules:
-            filename = f"{rule.name}.{self.RULES_EXTENSION}"
-            if self.project.namespace is not None:
-                filename = f"{self.project.namespace}-{filename}"
-
+            filename = f"{prefix}{rule.name}.{self.RULES_EXTENSION}"
             rule_file = rules_dir / filename
-            self.markdown_generator.generate(
+            written = self.markdown_generator.generate(
                 file=rule_file,
                 body=rule.prompt,
                 metadata={"description": rule.description, **rule.metadata},
@@ -129,41 +131,40 @@ class ClaudeConfigurator(AgentConfigurator):
             )
 
             relative_path = f"{self.RULES_DIR}/{filename}"
-            body += f"## {rule.description}\n\n"
-            body += f"@{relative_path}\n\n"
+            parts.append(f"## {rule.description}\n\n@{relative_path}\n\n")
 
-            self.tracker.track(f"Created {rule_file}")
+            track_file(self.tracker, rule_file, written)
 
-        self.markdown_generator.generate(file=rules_file, body=body.rstrip())
-        self.tracker.track(f"Created {rules_file}")
+        written = self.markdown_generator.generate(file=rules_file, body="".join(parts).rstrip())
+        track_file(self.tracker, rules_file, written)
 
     def subagents(self, subagents: list[Subagent]) -> None:
         if not subagents:
             return
 
-        subagents_dir = Path(self.project.dir) / self.SUBAGENTS_DIR
-        subagents_dir.mkdir(parents=True, exist_ok=True)
+        subagents_dir = self.__project_dir / self.SUBAGENTS_DIR
+        ensure_directory(subagents_dir)
 
+        prefix = namespace_prefix(self.project.namespace)
         for subagent in subagents:
             name = subagent.name
-            filename = f"{name}.{self.SUBAGENTS_EXTENSION}"
-            if self.project.namespace is not None:
-                filename = f"{self.project.namespace}-{filename}"
-
-            subagent_file = subagents_dir / filename
-            self.markdown_generator.generate(
+            subagent_file = subagents_dir / f"{prefix}{name}.{self.SUBAGENTS_EXTENSION}"
+            written = self.markdown_generator.generate(
                 file=subagent_file,
                 body=subagent.prompt,
                 metadata={"name": name, "description": subagent.description, **subagent.metadata},
                 allowed_metadata=["name", "description", *self.__ALLOWED_SUBAGENT_METADATA],
             )
 
-            self.tracker.track(f"Created {subagent_file}")
+            track_file(self.tracker, subagent_file, written)
 
     def skills(self, skills: list[Skill]) -> None:
+        skills_dir = self.__project_dir / self.SKILLS_DIR
+        prefix = namespace_prefix(self.project.namespace)
         for skill in skills:
             self.__write_skill(
-                name=skill.name,
+                skills_dir=skills_dir,
+                name=f"{prefix}{skill.name}",
                 description=skill.description,
                 prompt=skill.prompt,
                 metadata=skill.metadata,
@@ -172,34 +173,29 @@ class ClaudeConfigurator(AgentConfigurator):
 
     def __write_skill(
         self,
+        skills_dir: Path,
         name: str,
         description: str,
         prompt: str,
         metadata: dict[str, Any],
         files: dict[str, str] | None = None,
     ) -> None:
-        skills_dir = Path(self.project.dir) / self.SKILLS_DIR
-        skills_dir.mkdir(parents=True, exist_ok=True)
-
-        if self.project.namespace is not None:
-            name = f"{self.project.namespace}-{name}"
-
         skill_dir = skills_dir / name
-        skill_dir.mkdir(parents=True, exist_ok=True)
+        ensure_directory(skill_dir)
 
         skill_file = skill_dir / self.SKILLS_FILE
-        self.markdown_generator.generate(
+        written = self.markdown_generator.generate(
             file=skill_file,
             body=prompt,
             metadata={**metadata, "name": name, "description": description},
             allowed_metadata=["name", *self.__ALLOWED_SKILL_METADATA],
         )
 
-        self.tracker.track(f"Created {skill_file}")
+        track_file(self.tracker, skill_file, written)
 
         for relative_path, source_path in (files or {}).items():
             dest = skill_dir / relative_path
-            dest.parent.mkdir(parents=True, exist_ok=True)
+            ensure_directory(dest.parent)
             shutil.copy2(source_path, dest)
             self.tracker.track(f"Created {dest}")
 
@@ -207,18 +203,17 @@ class ClaudeConfigurator(AgentConfigurator):
         if not mcp_servers:
             return
 
-        file = Path(self.project.dir) / self.MCP_FILE
+        file = self.__project_dir / self.MCP_FILE
         self.mcp_server_generator.generate(file, mcp_servers)
 
-        settings_file_path = Path(self.project.dir) / self.SETTINGS_FILE
-        settings_file_path.parent.mkdir(parents=True, exist_ok=True)
+        settings_file_path = self.__project_dir / self.SETTINGS_FILE
+        ensure_directory(settings_file_path.parent)
 
         # Read existing settings if file exists
         existing_settings: dict[str, Any] = {}
         if settings_file_path.exists():
             try:
-                with open(settings_file_path, encoding="utf-8") as f:
-                    existing_settings = json.load(f)
+                existing_settings = read_json(settings_file_path)
             except (json.JSONDecodeError, OSError):
                 existing_settings = {}
 
@@ -231,18 +226,19 @@ class ClaudeConfigurator(AgentConfigurator):
 
         # Merge server names, avoiding duplicates
         existing_servers = existing_settings["enabledMcpjsonServers"]
+        seen_servers = set(existing_servers)
         for server_name in server_names:
-            if server_name not in existing_servers:
+            if server_name not in seen_servers:
+                seen_servers.add(server_name)
                 existing_servers.append(server_name)
 
         existing_settings["enabledMcpjsonServers"] = existing_servers
 
         # Write updated settings
-        with open(settings_file_path, "w", encoding="utf-8") as f:
-            json.dump(existing_settings, f, indent=2)
-            f.write("\n")
-
-        self.tracker.track(f"Enabled MCP servers in {settings_file_path}")
+        if write_json(settings_file_path, existing_settings):
+            self.tracker.track(f"Enabled MCP servers in {settings_file_path}")
+        else:
+            self.tracker.track(f"Unchanged {settings_file_path}")
 
     def assets(self, assets: list[str]) -> None:
         if not assets:
@@ -256,15 +252,14 @@ class ClaudeConfigurator(AgentConfigurator):
             self.tracker.track("No ignore patterns to add for Claude Code")
             return
 
-        settings_file_path = Path(self.project.dir) / self.SETTINGS_FILE
+        settings_file_path = self.__project_dir / self.SETTINGS_FILE
         self.tracker.track(f"Configuring Claude Code ignore patterns in {settings_file_path}")
 
         # Read existing settings if file exists
         existing_settings: dict[str, Any] = {}
         if settings_file_path.exists():
             try:
-                with open(settings_file_path, encoding="utf-8") as f:
-                    existing_settings = json.load(f)
+                existing_settings = read_json(settings_file_path)
             except (json.JSONDecodeError, OSError):
                 # If file is corrupted or can't be read, start fresh
                 existing_settings = {}
@@ -283,18 +278,19 @@ class ClaudeConfigurator(AgentConfigurator):
         existing_deny = existing_settings["permissions"]["deny"]
 
         # Add new rules, avoiding duplicates
+        seen_deny = set(existing_deny)
         for rule in deny_rules:
-            if rule not in existing_deny:
+            if rule not in seen_deny:
+                seen_deny.add(rule)
                 existing_deny.append(rule)
 
         existing_settings["permissions"]["deny"] = existing_deny
 
         # Ensure parent directory exists
-        settings_file_path.parent.mkdir(parents=True, exist_ok=True)
+        ensure_directory(settings_file_path.parent)
 
         # Write updated settings
-        with open(settings_file_path, "w", encoding="utf-8") as f:
-            json.dump(existing_settings, f, indent=2)
-            f.write("\n")  # Add trailing newline
-
-        self.tracker.track(f"Updated ignore patterns in {settings_file_path}")
+        if write_json(settings_file_path, existing_settings):
+            self.tracker.track(f"Updated ignore patterns in {settings_file_path}")
+        else:
+            self.tracker.track(f"Unchanged {settings_file_path}")
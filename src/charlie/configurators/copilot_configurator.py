@@ -2,9 +2,10 @@ from pathlib import Path
 from typing import final
 
 from charlie.assets_manager import AssetsManager
-from charlie.configurators.agent_configurator import AgentConfigurator
+from charlie.configurators.agent_configurator import AgentConfigurator, namespace_prefix, track_file
 from charlie.enums import RuleMode
-from charlie.markdown_generator import MarkdownGenerator
+from charlie.filesystem import ensure_directory
+from charlie.markdown_generator import MarkdownDocument, MarkdownGenerator
 from charlie.schema import Command, MCPServer, Project, Rule, Skill, Subagent
 from charlie.tracker import Tracker
 
@@ -31,6 +32,7 @@ class CopilotConfigurator(AgentConfigurator):
         short_name: str,
     ):
         self.project = project
+        self.__project_dir = Path(project.dir)
         self.tracker = tracker
         self.markdown_generator = markdown_generator
         self.assets_manager = assets_manager
@@ -50,88 +52,92 @@ class CopilotConfigurator(AgentConfigurator):
         }
 
     def commands(self, commands: list[Command]) -> None:
-        prompts_dir = Path(self.project.dir) / self.COMMANDS_DIR
-        prompts_dir.mkdir(parents=True, exist_ok=True)
-
-        prompts = {}
-        # Create individual prompt files
-        for command in commands:
-            name = command.name
-            filename = f"{name}.{self.COMMANDS_EXTENSION}"
-            if self.project.namespace is not None:
-                filename = f"{self.project.namespace}-{filename}"
-
-            prompt_file = prompts_dir / filename
-            self.markdown_generator.generate(
-                file=prompt_file,
+        prompts_dir = self.__project_dir / self.COMMANDS_DIR
+        ensure_directory(prompts_dir)
+
+        prefix = namespace_prefix(self.project.namespace)
+        filenames = [f"{prefix}{command.name}.{self.COMMANDS_EXTENSION}" for command in commands]
+        documents = [
+            MarkdownDocument(
+                file=prompts_dir / filename,
                 body=command.prompt,
                 metadata={"description": command.description, **command.metadata},
                 allowed_metadata=self.__ALLOWED_COMMAND_METADATA,
             )
+            for command, filename in zip(commands, filenames, strict=True)
+        ]
+        prompts = {
+            command.name: (filename, command.description) for command, filename in zip(commands, filenames, strict=True)
+        }
 
-            prompts[name] = (filename, command.description)
-            self.tracker.track(f"Created {prompt_file}")
+        self.markdown_generator.generate_all(
+            documents, lambda document, written: track_file(self.tracker, document.file, written)
+        )
 
-        instructions_file = Path(self.project.dir) / self.RULES_DIR / "enable-slash-commands.md"
-        instructions_file.parent.mkdir(parents=True, exist_ok=True)
+        instructions_file = self.__project_dir / self.RULES_DIR / "enable-slash-commands.md"
+        ensure_directory(instructions_file.parent)
 
-        body = f"You can use slash commands from the `{self.COMMANDS_DIR}` directory. "
-        body += "Each command is a reusable prompt that you can invoke with `/command-name`.\n\n"
-        body += "Available commands:\n\n"
+        parts = [
+            f"You can use slash commands from the `{self.COMMANDS_DIR}` directory. ",
+            "Each command is a reusable prompt that you can invoke with `/command-name`.\n\n",
+            "Available commands:\n\n",
+        ]
 
-        for name, (filename, description) in prompts.items():
-            body += f"- `/{name}`: {description} (file: `{filename}`)\n"
+        parts.extend(
+            f"- `/{name}`: {description} (file: `{filename}`)\n" for name, (filename, description) in prompts.items()
+        )
 
-        self.markdown_generator.generate(
-            file=instructions_file, body=body.rstrip(), metadata={"description": "Enable slash commands"}
+        written = self.markdown_generator.generate(
+            file=instructions_file, body="".join(parts).rstrip(), metadata={"description": "Enable slash commands"}
         )
-        self.tracker.track(f"Created {instructions_file}")
+        track_file(self.tracker, instructions_file, written)
 
     def rules(self, rules: list[Rule], mode: RuleMode) -> None:
         if not rules:
             return
 
         if mode == RuleMode.MERGED:
-            instructions_file = Path(self.project.dir) / self.RULES_FILE
-            instructions_file.parent.mkdir(parents=True, exist_ok=True)
+            instructions_file = self.__project_dir / self.RULES_FILE
+            ensure_directory(instructions_file.parent)
 
-            body = f"# {self.project.name}\n\n"
+            parts = [f"# {self.project.name}\n\n"]
 
             for rule in rules:
-                body += f"## {rule.description}\n\n"
-                body += f"{rule.prompt}\n\n"
+                parts.append(f"## {rule.description}\n\n{rule.prompt}\n\n")
 
-            self.markdown_generator.generate(file=instructions_file, body=body.rstrip())
-            self.tracker.track(f"Created {instructions_file}")
+            written = self.markdown_generator.generate(file=instructions_file, body="".join(parts).rstrip())
+            track_file(self.tracker, instructions_file, written)
             return
 
-        rules_dir = Path(self.project.dir) / self.RULES_DIR
-        rules_dir.mkdir(parents=True, exist_ok=True)
+        rules_dir = self.__project_dir / self.RULES_DIR
+        ensure_directory(rules_dir)
 
-        body = f"# {self.project.name}\n\n"
+        parts = [f"# {self.project.name}\n\n"]
+        documents: list[MarkdownDocument] = []
 
+        prefix = namespace_prefix(self.project.namespace)
         for rule in rules:
-            filename = f"{rule.name}-instructions.{self.RULES_EXTENSION}"
-            if self.project.namespace is not None:
-                filename = f"{self.project.namespace}-{filename}"
-
-            rule_file = rules_dir / filename
-            self.markdown_generator.generate(
-                file=rule_file,
-                body=rule.prompt,
-                metadata={"description": rule.description, **rule.metadata},
-                allowed_metadata=self.__ALLOWED_INSTRUCTION_METADATA,
+            filename = f"{prefix}{rule.name}-instructions.{self.RULES_EXTENSION}"
+
+            documents.append(
+                MarkdownDocument(
+                    file=rules_dir / filename,
+                    body=rule.prompt,
+                    metadata={"description": rule.description, **rule.metadata},
+                    allowed_metadata=self.__ALLOWED_INSTRUCTION_METADATA,
+                )
             )
 
             relative_path = f"{self.RULES_DIR}/{filename}"
-            body += f"## {rule.description}\n\n"
-            body += f"See @{relative_path}\n\n"
+            parts.append(f"## {rule.description}\n\nSee @{relative_path}\n\n")
 
-            self.tracker.track(f"Created {rule_file}")
+        self.markdown_generator.generate_all(
+            documents, lambda document, written: track_file(self.tracker, document.file, written)
+        )
 
-        instructions_file = Path(self.project.dir) / self.RULES_FILE
-        self.markdown_generator.generate(file=instructions_file, body=body.rstrip())
-        self.tracker.track(f"Created {instructions_file}")
+        instructions_file = self.__project_dir / self.RULES_FILE
+        written = self.markdown_generator.generate(file=instructions_file, body="".join(parts).rstrip())
+        track_file(self.tracker, instructions_file, written)
 
     def subagents(self, subagents: list[Subagent]) -> None:
         if subagents:
@@ -149,7 +155,7 @@ class CopilotConfigurator(AgentConfigurator):
         if not assets:
             return
 
-        destination_base = Path(self.project.dir) / self.ASSETS_DIR
+        destination_base = self.__project_dir / self.ASSETS_DIR
         self.assets_manager.copy_assets(assets, destination_base)
 
     def ignore_file(self, patterns: list[str]) -> None:
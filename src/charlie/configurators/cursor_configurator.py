@@ -3,9 +3,10 @@ from pathlib import Path
 from typing import final
 
 from charlie.assets_manager import AssetsManager
-from charlie.configurators.agent_configurator import AgentConfigurator
+from charlie.configurators.agent_configurator import AgentConfigurator, namespace_prefix, track_file
 from charlie.enums import RuleMode
-from charlie.markdown_generator import MarkdownGenerator
+from charlie.filesystem import ensure_directory, write_text
+from charlie.markdown_generator import MarkdownDocument, MarkdownGenerator
 from charlie.mcp_server_generator import MCPServerGenerator
 from charlie.schema import Command, MCPServer, Project, Rule, Skill, Subagent
 from charlie.tracker import Tracker
@@ -42,6 +43,7 @@ class CursorConfigurator(AgentConfigurator):
         short_name: str,
     ):
         self.project = project
+        self.__project_dir = Path(project.dir)
         self.tracker = tracker
         self.markdown_generator = markdown_generator
         self.mcp_server_generator = mcp_server_generator
@@ -64,117 +66,107 @@ class CursorConfigurator(AgentConfigurator):
         }
 
     def commands(self, commands: list[Command]) -> None:
-        commands_dir = Path(self.project.dir) / self.COMMANDS_DIR
-        commands_dir.mkdir(parents=True, exist_ok=True)
+        commands_dir = self.__project_dir / self.COMMANDS_DIR
+        ensure_directory(commands_dir)
+        prefix = namespace_prefix(self.project.namespace, ".")
+        documents: list[MarkdownDocument] = []
         for command in commands:
-            name = command.name
-            filename = f"{name}.{self.COMMANDS_EXTENSION}"
-            if self.project.namespace is not None:
-                name = f"{self.project.namespace}.{name}"
-                filename = f"{self.project.namespace}.{filename}"
-
-            command_file = commands_dir / filename
-            self.markdown_generator.generate(
-                file=command_file,
-                body=command.prompt,
-                metadata={"description": command.description, "name": name, **command.metadata},
-                allowed_metadata=self.__ALLOWED_COMMAND_METADATA,
+            name = f"{prefix}{command.name}"
+            documents.append(
+                MarkdownDocument(
+                    file=commands_dir / f"{name}.{self.COMMANDS_EXTENSION}",
+                    body=command.prompt,
+                    metadata={"description": command.description, "name": name, **command.metadata},
+                    allowed_metadata=self.__ALLOWED_COMMAND_METADATA,
+                )
             )
 
-            self.tracker.track(f"Created {command_file}")
+        self.markdown_generator.generate_all(
+            documents, lambda document, written: track_file(self.tracker, document.file, written)
+        )
 
     def rules(self, rules: list[Rule], mode: RuleMode) -> None:
         if not rules:
             return
 
         if mode == RuleMode.MERGED:
-            rules_file = Path(self.project.dir) / self.RULES_FILE
-            rules_file.parent.mkdir(parents=True, exist_ok=True)
-            body = f"# {self.project.name} guidelines"
+            rules_file = self.__project_dir / self.RULES_FILE
+            ensure_directory(rules_file.parent)
+            parts = [f"# {self.project.name} guidelines"]
 
             for rule in rules:
-                body += f"\n\n## {rule.description}"
-                body += f"\n\n{rule.prompt}"
+                parts.append(f"\n\n## {rule.description}\n\n{rule.prompt}")
 
-            self.markdown_generator.generate(file=rules_file, body=body)
+            written = self.markdown_generator.generate(file=rules_file, body="".join(parts))
 
-            self.tracker.track(f"Created {rules_file}")
+            track_file(self.tracker, rules_file, written)
             return
 
-        rules_dir = Path(self.project.dir) / self.RULES_DIR
-        rules_dir.mkdir(parents=True, exist_ok=True)
+        rules_dir = self.__project_dir / self.RULES_DIR
+        ensure_directory(rules_dir)
+        prefix = namespace_prefix(self.project.namespace, ".")
         for rule in rules:
-            filename = f"{rule.name}.{self.RULES_EXTENSION}"
-            if self.project.namespace is not None:
-                filename = f"{self.project.namespace}.{filename}"
-
-            command_file = rules_dir / filename
-            self.markdown_generator.generate(
+            command_file = rules_dir / f"{prefix}{rule.name}.{self.RULES_EXTENSION}"
+            written = self.markdown_generator.generate(
                 file=command_file,
                 body=rule.prompt,
                 metadata={"description": rule.description, **rule.metadata},
                 allowed_metadata=self.__ALLOWED_INSTRUCTION_METADATA,
             )
 
-            self.tracker.track(f"Created {command_file}")
+            track_file(self.tracker, command_file, written)
 
     def subagents(self, subagents: list[Subagent]) -> None:
         if not subagents:
             return
 
-        subagents_dir = Path(self.project.dir) / self.SUBAGENTS_DIR
-        subagents_dir.mkdir(parents=True, exist_ok=True)
+        subagents_dir = self.__project_dir / self.SUBAGENTS_DIR
+        ensure_directory(subagents_dir)
 
+        prefix = namespace_prefix(self.project.namespace, ".")
         for subagent in subagents:
-            name = subagent.name
-            filename = f"{name}.{self.SUBAGENTS_EXTENSION}"
-            if self.project.namespace is not None:
-                name = f"{self.project.namespace}.{name}"
-                filename = f"{self.project.namespace}.{filename}"
-
-            subagent_file = subagents_dir / filename
-            self.markdown_generator.generate(
+            name = f"{prefix}{subagent.name}"
+            subagent_file = subagents_dir / f"{name}.{self.SUBAGENTS_EXTENSION}"
+            written = self.markdown_generator.generate(
                 file=subagent_file,
                 body=subagent.prompt,
                 metadata={"name": name, "description": subagent.description, **subagent.metadata},
                 allowed_metadata=self.__ALLOWED_SUBAGENT_METADATA,
             )
 
-            self.tracker.track(f"Created {subagent_file}")
+            track_file(self.tracker, subagent_file, written)
 
     def skills(self, skills: list[Skill]) -> None:
         if not skills:
             return
 
-        skills_dir = Path(self.project.dir) / self.SKILLS_DIR
-        skills_dir.mkdir(parents=True, exist_ok=True)
+        skills_dir = self.__project_dir / self.SKILLS_DIR
+        ensure_directory(skills_dir)
 
+        prefix = namespace_prefix(self.project.namespace, ".")
         for skill in skills:
-            name = skill.name
-            if self.project.namespace is not None:
-                name = f"{self.project.namespace}.{name}"
-
+            name = f"{prefix}{skill.name}"
             skill_dir = skills_dir / name
-            skill_dir.mkdir(parents=True, exist_ok=True)
+            ensure_directory(skill_dir)
 
             skill_file = skill_dir / self.SKILLS_FILE
-            self.markdown_generator.generate(
+            written = self.markdown_generator.generate(
                 file=skill_file,
                 body=skill.prompt,
                 metadata={**skill.metadata, "name": name, "description": skill.description},
                 allowed_metadata=self.__ALLOWED_SKILL_METADATA,
             )
 
-            self.tracker.track(f"Created {skill_file}")
+            track_file(self.tracker, skill_file, written)
 
             for relative_path, source_path in skill.files.items():
                 dest = skill_dir / relative_path
-                dest.parent.mkdir(parents=True, exist_ok=True)
+                ensure_directory(dest.parent)
                 shutil.copy2(source_path, dest)
                 self.tracker.track(f"Created {dest}")
 
     def mcp_servers(self, mcp_servers: list[MCPServer]) -> None:
-        file = Path(self.project.dir) / self.MCP_FILE
+        file = self.__project_dir / self.MCP_FILE
         self.mcp_server_generator.generate(file, mcp_servers)
 
     def assets(self, assets: list[str]) -> None:
@@ -185,7 +177,7 @@ class CursorConfigurator(AgentConfigurator):
         self.assets_manager.copy_assets(assets, destination_base)
 
     def ignore_file(self, patterns: list[str]) -> None:
-        ignore_file_path = Path(self.project.dir) / self.IGNORE_FILE
+        ignore_file_path = self.__project_dir / self.IGNORE_FILE
 
         # Create the ignore file content
         content_lines = [
@@ -200,10 +192,10 @@ class CursorConfigurator(AgentConfigurator):
         content = "\n".join(content_lines) + "\n"
 
         # Ensure parent directory exists
-        ignore_file_path.parent.mkdir(parents=True, exist_ok=True)
+        ensure_directory(ignore_file_path.parent)
 
         # Write the ignore file
-        with open(ignore_file_path, "w", encoding="utf-8") as f:
-            f.write(content)
-
-        self.tracker.track(f"Generated ignore file: {ignore_file_path}")
+        if write_text(ignore_file_path, content):
+            self.tracker.track(f"Generated ignore file: {ignore_file_path}")
+        else:
+            self.tracker.track(f"Unchanged {ignore_file_path}")
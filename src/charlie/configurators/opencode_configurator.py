@@ -1,12 +1,12 @@
-import json
 import shutil
 from pathlib import Path
 from typing import Any, final
 
 from charlie.assets_manager import AssetsManager
-from charlie.configurators.agent_configurator import AgentConfigurator
+from charlie.configurators.agent_configurator import AgentConfigurator, namespace_prefix, track_file
 from charlie.enums import RuleMode
-from charlie.markdown_generator import MarkdownGenerator
+from charlie.filesystem import ensure_directory, read_json, write_json
+from charlie.markdown_generator import MarkdownDocument, MarkdownGenerator
 from charlie.schema import Command, HttpMCPServer, MCPServer, Project, Rule, Skill, StdioMCPServer, Subagent
 from charlie.tracker import Tracker
 
@@ -46,10 +46,12 @@ class OpencodeConfigurator(AgentConfigurator):
         short_name: str,
     ):
         self.project = project
+        self.__project_dir = Path(project.dir)
         self.tracker = tracker
         self.markdown_generator = markdown_generator
         self.assets_manager = assets_manager
         self.short_name = short_name
+        self.__config: dict[str, Any] | None = None
 
     def placeholders(self) -> dict[str, str]:
         return {
@@ -67,9 +69,12 @@ class OpencodeConfigurator(AgentConfigurator):
         }
 
     def commands(self, commands: list[Command]) -> None:
+        skills_dir = self.__project_dir / self.SKILLS_DIR
+        prefix = namespace_prefix(self.project.namespace)
         for command in commands:
             self.__write_skill(
-                name=command.name,
+                skills_dir=skills_dir,
+                name=f"{prefix}{command.name}",
                 description=command.description,
                 prompt=command.prompt,
                 metadata=command.metadata,
@@ -79,91 +84,101 @@ class OpencodeConfigurator(AgentConfigurator):
         if not rules:
             return
 
-        rules_dir = Path(self.project.dir) / self.RULES_DIR
-        rules_dir.mkdir(parents=True, exist_ok=True)
+        rules_dir = self.__project_dir / self.RULES_DIR
+        ensure_directory(rules_dir)
 
         instruction_paths: list[str] = []
+        prefix = namespace_prefix(self.project.namespace)
 
         if mode == RuleMode.MERGED:
-            filename = "instructions.md"
-            if self.project.namespace is not None:
-                filename = f"{self.project.namespace}-{filename}"
+            filename = f"{prefix}instructions.md"
 
             rule_file = rules_dir / filename
-            body = f"# {self.project.name}\n\n"
+            parts = [f"# {self.project.name}\n\n"]
             for rule in rules:
-                body += f"## {rule.description}\n\n"
-                body += f"{rule.prompt}\n\n"
+                parts.append(f"## {rule.description}\n\n{rule.prompt}\n\n")
 
-            self.markdown_generator.generate(file=rule_file, body=body.rstrip())
-            self.tracker.track(f"Created {rule_file}")
+            written = self.markdown_generator.generate(file=rule_file, body="".join(parts).rstrip())
+            track_file(self.tracker, rule_file, written)
             instruction_paths.append(f"{self.RULES_DIR}/{filename}")
         else:
+            documents: list[MarkdownDocument] = []
             for rule in rules:
-                filename = f"{rule.name}.{self.RULES_EXTENSION}"
-                if self.project.namespace is not None:
-                    filename = f"{self.project.namespace}-{filename}"
-
-                rule_file = rules_dir / filename
-                self.markdown_generator.generate(
-                    file=rule_file,
-                    body=rule.prompt,
-                )
-                self.tracker.track(f"Created {rule_file}")
+                filename = f"{prefix}{rule.name}.{self.RULES_EXTENSION}"
+
+                documents.append(MarkdownDocument(file=rules_dir / filename, body=rule.prompt))
                 instruction_paths.append(f"{self.RULES_DIR}/{filename}")
 
+            self.markdown_generator.generate_all(
+                documents, lambda document, written: track_file(self.tracker, document.file, written)
+            )
+
         self.__add_instructions(instruction_paths)
 
     def __add_instructions(self, paths: list[str]) -> None:
-        file = Path(self.project.dir) / self.MCP_FILE
-
-        config: dict[str, Any] = {}
-        if file.exists():
-            with open(file, encoding="utf-8") as f:
-                config = json.load(f)
-
-        if "$schema" not in config:
-            config["$schema"] = "https://opencode.ai/config.json"
+        config = self.__load_config()
 
         existing: list[str] = config.get("instructions", [])
+        seen = set(existing)
         for path in paths:
-            if path not in existing:
+            if path not in seen:
+                seen.add(path)
                 existing.append(path)
         config["instructions"] = existing
 
-        with open(file, "w", encoding="utf-8") as f:
-            json.dump(config, f, indent=2)
+        self.__save_config("Updated")
+
+    def __load_config(self) -> dict[str, Any]:
+        if self.__config is None:
+            file = self.__project_dir / self.MCP_FILE
+
+            config: dict[str, Any] = {}
+            if file.exists():
+                config = read_json(file)
+
+            if "$schema" not in config:
+                config["$schema"] = "https://opencode.ai/config.json"
 
-        self.tracker.track(f"Updated {file}")
+            self.__config = config
+
+        return self.__config
+
+    def __save_config(self, action: str) -> None:
+        file = self.__project_dir / self.MCP_FILE
+        if write_json(file, self.__load_config()):
+            self.tracker.track(f"{action} {file}")
+        else:
+            self.tracker.track(f"Unchanged {file}")
 
     def subagents(self, subagents: list[Subagent]) -> None:
         if not subagents:
             return
 
-        subagents_dir = Path(self.project.dir) / self.SUBAGENTS_DIR
-        subagents_dir.mkdir(parents=True, exist_ok=True)
+        subagents_dir = self.__project_dir / self.SUBAGENTS_DIR
+        ensure_directory(subagents_dir)
 
+        prefix = namespace_prefix(self.project.namespace)
         for subagent in subagents:
-            name = subagent.name
+            name = f"{prefix}{subagent.name}"
             filename = f"{name}.{self.SUBAGENTS_EXTENSION}"
-            if self.project.namespace is not None:
-                name = f"{self.project.namespace}-{name}"
-                filename = f"{self.project.namespace}-{filename}"
 
             subagent_file = subagents_dir / filename
-            self.markdown_generator.generate(
+            written = self.markdown_generator.generate(
                 file=subagent_file,
                 body=subagent.prompt,
                 metadata={"name": name, "description": subagent.description, **subagent.metadata},
                 allowed_metadata=["name", "description", *self.__ALLOWED_SUBAGENT_METADATA],
             )
 
-            self.tracker.track(f"Created {subagent_file}")
+            track_file(self.tracker, subagent_file, written)
 
     def skills(self, skills: list[Skill]) -> None:
+        skills_dir = self.__project_dir / self.SKILLS_DIR
+        prefix = namespace_prefix(self.project.namespace)
         for skill in skills:
             self.__write_skill(
-                name=skill.name,
+                skills_dir=skills_dir,
+                name=f"{prefix}{skill.name}",
                 description=skill.description,
                 prompt=skill.prompt,
                 metadata=skill.metadata,
@@ -172,34 +187,29 @@ class OpencodeConfigurator(AgentConfigurator):
 
     def __write_skill(
         self,
+        skills_dir: Path,
         name: str,
         description: str,
         prompt: str,
         metadata: dict[str, Any],
         files: dict[str, str] | None = None,
     ) -> None:
-        skills_dir = Path(self.project.dir) / self.SKILLS_DIR
-        skills_dir.mkdir(parents=True, exist_ok=True)
-
-        if self.project.namespace is not None:
-            name = f"{self.project.namespace}-{name}"
-
         skill_dir = skills_dir / name
-        skill_dir.mkdir(parents=True, exist_ok=True)
+        ensure_directory(skill_dir)
 
         skill_file = skill_dir / self.SKILLS_FILE
-        self.markdown_generator.generate(
+        written = self.markdown_generator.generate(
             file=skill_file,
             body=prompt,
             metadata={**metadata, "name": name, "description": description},
             allowed_metadata=["name", *self.__ALLOWED_SKILL_METADATA],
         )
 
-        self.tracker.track(f"Created {skill_file}")
+        track_file(self.tracker, skill_file, written)
 
         for relative_path, source_path in (files or {}).items():
             dest = skill_dir / relative_path
-            dest.parent.mkdir(parents=True, exist_ok=True)
+            ensure_directory(dest.parent)
             shutil.copy2(source_path, dest)
             self.tracker.track(f"Created {dest}")
 
@@ -207,15 +217,7 @@ class OpencodeConfigurator(AgentConfigurator):
         if not mcp_servers:
             return
 
-        file = Path(self.project.dir) / self.MCP_FILE
-
-        config: dict[str, Any] = {}
-        if file.exists():
-            with open(file, encoding="utf-8") as f:
-                config = json.load(f)
-
-        if "$schema" not in config:
-            config["$schema"] = "https://opencode.ai/config.json"
+        config = self.__load_config()
 
         if "mcp" not in config:
             config["mcp"] = {}
@@ -240,16 +242,13 @@ class OpencodeConfigurator(AgentConfigurator):
 
             config["mcp"][server.name] = server_config
 
-        with open(file, "w", encoding="utf-8") as f:
-            json.dump(config, f, indent=2)
-
-        self.tracker.track(f"Created {file}")
+        self.__save_config("Created")
 
     def assets(self, assets: list[str]) -> None:
         if not assets:
             return
 
-        destination_base = Path(self.project.dir) / self.ASSETS_DIR
+        destination_base = self.__project_dir / self.ASSETS_DIR
         self.assets_manager.copy_assets(assets, destination_base)
 
     def ignore_file(self, patterns: list[str]) -> None:
@@ -0,0 +1,109 @@
+import json
+import math
+import os
+from pathlib import Path
+from typing import Any
+
+try:
+    import orjson
+
+    _HAS_ORJSON = True
+except ImportError:
+    _HAS_ORJSON = False
+
+_READ_FLAGS = os.O_RDONLY | getattr(os, "O_BINARY", 0)
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+
+
+def ensure_directory(directory: Path) -> None:
+    os.makedirs(directory, exist_ok=True)
+
+
+def read_bytes(file: Path) -> bytes:
+    # Config files are small, so a sized read skips the buffered file object and usually needs one syscall
+    fd = os.open(file, _READ_FLAGS)
+    try:
+        size = os.fstat(fd).st_size
+        data = os.read(fd, size + 1)
+        if len(data) <= size:
+            return data
+
+        chunks = [data]
+        while chunk := os.read(fd, 65536):
+            chunks.append(chunk)
+
+        return b"".join(chunks)
+    finally:
+        os.close(fd)
+
+
+def write_text(file: Path, *parts: str, encoding: str = "utf-8") -> bool:
+    return _write_bytes(file, [part.encode(encoding) for part in parts if part])
+
+
+def _write_bytes(file: Path, chunks: list[bytes]) -> bool:
+    size = sum(len(chunk) for chunk in chunks)
+    if _has_content(file, chunks, size):
+        return False
+
+    fd = os.open(file, _WRITE_FLAGS, 0o666)
+    try:
+        written = os.writev(fd, chunks) if chunks and hasattr(os, "writev") else 0
+        if written == size:
+            return True
+
+        # writev may stop early; finish with plain writes
+        remaining = memoryview(b"".join(chunks))[written:]
+        while remaining:
+            remaining = remaining[os.write(fd, remaining) :]
+    finally:
+        os.close(fd)
+
+    return True
+
+
+def _has_content(file: Path, chunks: list[bytes], size: int) -> bool:
+    try:
+        existing_size = os.stat(file).st_size
+    except OSError:
+        return False
+
+    # Comparing sizes first avoids reading files that clearly changed
+    if existing_size != size:
+        return False
+
+    return read_bytes(file) == b"".join(chunks)
+
+
+def read_json(file: Path) -> Any:
+    data = read_bytes(file)
+
+    if _HAS_ORJSON:
+        return orjson.loads(data)
+
+    return json.loads(data.decode("utf-8"))
+
+
+def write_json(file: Path, data: object) -> bool:
+    if _HAS_ORJSON and _formats_alike(data):
+        try:
+            content = orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+        except orjson.JSONEncodeError:
+            pass
+        else:
+            return _write_bytes(file, [content])
+
+    return write_text(file, json.dumps(data, indent=2), "\n")
+
+
+def _formats_alike(data: object) -> bool:
+    # json escapes non-ASCII and DEL, and writes "1e+16" and NaN where orjson writes raw text, "1e16" and null
+    if isinstance(data, str):
+        return data.isascii() and "\x7f" not in data
+    if isinstance(data, float):
+        return math.isfinite(data) and "e" not in repr(data)
+    if isinstance(data, dict):
+        return all(_formats_alike(key) and _formats_alike(value) for key, value in data.items())
+    if isinstance(data, list | tuple):
+        return all(_formats_alike(value) for value in data)
+    return True
@@ -1,10 +1,22 @@
+from collections.abc import Callable
+from dataclasses import dataclass
 from pathlib import Path
 from typing import final
 
-import yaml
-
+from charlie.filesystem import write_text
 from charlie.schema import Metadata
 
+_PARALLEL_THRESHOLD = 2
+_MAX_WORKERS = 32
+
+
+@dataclass(frozen=True, slots=True)
+class MarkdownDocument:
+    file: Path
+    body: str
+    metadata: Metadata | None = None
+    allowed_metadata: list[str] | None = None
+
 
 @final
 class MarkdownGenerator:
@@ -17,13 +29,58 @@ class MarkdownGenerator:
         body: str,
         metadata: Metadata | None = None,
         allowed_metadata: list[str] | None = None,
-    ) -> None:
+    ) -> bool:
         frontmatter = ""
         if metadata is not None and allowed_metadata is not None:
-            metadata = {key: value for key, value in metadata.items() if key in allowed_metadata}
+            allowed_keys = set(allowed_metadata)
+            metadata = {key: value for key, value in metadata.items() if key in allowed_keys}
 
         if metadata is not None:
-            yaml_str = yaml.dump(metadata, default_flow_style=False, sort_keys=False, width=10**9)
-            frontmatter += f"---\n{yaml_str}---\n\n"
+            import yaml
+
+            # libyaml's dumper emits the same output as the pure-Python one, much faster
+            dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+            yaml_str = yaml.dump(metadata, Dumper=dumper, default_flow_style=False, sort_keys=False, width=10**9)
+            frontmatter = f"---\n{yaml_str}---\n\n"
+
+        return write_text(file, frontmatter, body, encoding=self.encoding)
+
+    def generate_all(
+        self,
+        documents: list[MarkdownDocument],
+        on_generated: Callable[[MarkdownDocument, bool], None] | None = None,
+    ) -> None:
+        # Concurrent writes to one path would race, so the last document for a path wins as it would sequentially
+        documents = list({document.file: document for document in documents}.values())
+
+        # Thread start-up costs more than a couple of small writes
+        if len(documents) <= _PARALLEL_THRESHOLD:
+            for document in documents:
+                written = self.__generate_document(document)
+                if on_generated is not None:
+                    on_generated(document, written)
+            return
+
+        from concurrent.futures import ThreadPoolExecutor
+
+        error: BaseException | None = None
+        with ThreadPoolExecutor(max_workers=min(_MAX_WORKERS, len(documents))) as executor:
+            futures = [(document, executor.submit(self.__generate_document, document)) for document in documents]
+            # Waiting in submission order keeps reports in input order, and every written document is still reported
+            for document, future in futures:
+                future_error = future.exception()
+                if future_error is not None:
+                    error = error or future_error
+                elif on_generated is not None:
+                    on_generated(document, future.result())
+
+        if error is not None:
+            raise error
 
-        file.write_text(frontmatter + body, encoding=self.encoding)
+    def __generate_document(self, document: MarkdownDocument) -> bool:
+        return self.generate(
+            file=document.file,
+            body=document.body,
+            metadata=document.metadata,
+            allowed_metadata=document.allowed_metadata,
+        )
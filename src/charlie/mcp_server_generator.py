@@ -1,6 +1,7 @@
 import json
 from pathlib import Path
 
+from charlie.filesystem import ensure_directory, read_json, write_json
 from charlie.schema import MCPServer
 from charlie.tracker import Tracker
 
@@ -13,32 +14,25 @@ class MCPServerGenerator:
         if not mcp_servers:
             return
 
-        file.parent.mkdir(parents=True, exist_ok=True)
+        ensure_directory(file.parent)
 
         existing_servers: dict[str, object] = {}
         if file.exists():
             try:
-                with open(file, encoding="utf-8") as open_file:
-                    existing_config = json.load(open_file)
-                    existing_servers = existing_config.get("mcpServers", {})
+                existing_config = read_json(file)
+                existing_servers = existing_config.get("mcpServers", {})
             except (json.JSONDecodeError, KeyError):
                 existing_servers = {}
 
         for mcp_server in mcp_servers:
             raw = mcp_server.model_dump(mode="json", exclude={"name"})
-            server = {}
-            for k, v in raw.items():
-                if k == "type" and v == "stdio":
-                    continue
-                if not v and not isinstance(v, (bool, int, float)):
-                    continue
-                server[k] = v
+            if raw.get("type") == "stdio":
+                del raw["type"]
+            server = {k: v for k, v in raw.items() if v or isinstance(v, (bool, int, float))}
             is_update = mcp_server.name in existing_servers
             existing_servers[mcp_server.name] = server
 
             action = "Updated" if is_update else "Added"
             self.tracker.track(f"{action} MCP server '{mcp_server.name}' in {file}")
 
-        with open(file, "w", encoding="utf-8") as open_file:
-            json.dump({"mcpServers": existing_servers}, open_file, indent=2)
-            open_file.write("\n")
+        write_json(file, {"mcpServers": existing_servers})
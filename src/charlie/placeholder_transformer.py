@@ -1,5 +1,8 @@
+import functools
 import os
 import re
+from collections.abc import Mapping
+from types import MappingProxyType
 from typing import Any, final
 
 from charlie.schema import (
@@ -10,7 +13,6 @@ from charlie.schema import (
     ReplacementSpec,
     Rule,
     Skill,
-    StdioMCPServer,
     Subagent,
 )
 
@@ -27,6 +29,45 @@ class ChoiceNotFoundError(Exception):
     pass
 
 
+_PLACEHOLDER_RE = re.compile(r"\{\{([^{}]+)\}\}")
+_ENV_RE = re.compile(r"\{\{env:([A-Za-z_][A-Za-z0-9_]*)\}\}")
+_FIXED_RE = re.compile(r"\{\{(?:env:([A-Za-z_][A-Za-z0-9_]*)|([^{}]+))\}\}")
+
+_FIXED_CACHE_SIZE = 1024
+
+
+def _env_value(environment: dict[str, str], var_name: str) -> str:
+    value = environment.get(var_name)
+    if value is not None:
+        return value
+
+    value = os.getenv(var_name)
+    if value is None:
+        raise EnvironmentVariableNotFoundError(
+            f"Environment variable '{var_name}' not found. Make sure it's set in your environment or .env file."
+        )
+
+    environment[var_name] = value
+
+    return value
+
+
+def _replace_env(environment: dict[str, str], match: re.Match[str]) -> str:
+    return _env_value(environment, match.group(1))
+
+
+def _placeholder_value(values: dict[str, str], match: re.Match[str]) -> str:
+    return values.get(match.group(1), match.group(0))
+
+
+def _fixed_value(values: dict[str, str], environment: dict[str, str], match: re.Match[str]) -> str:
+    env_name = match.group(1)
+    if env_name is not None:
+        return _env_value(environment, env_name)
+
+    return values.get(match.group(2), match.group(0))
+
+
 @final
 class PlaceholderTransformer:
     def __init__(
@@ -35,154 +76,182 @@ class PlaceholderTransformer:
         variables: dict[str, str],
         project: Project,
     ):
-        self.placeholders = placeholders
-        self.variables = variables
-        self.project = project
+        # Every value below is derived from these copies, so they are only exposed read-only and cannot go stale
+        self.__placeholder_map = dict(placeholders)
+        self.__variables = dict(variables)
+        self.__project = project.model_copy()
+        self.__project_dir_abs = os.path.abspath(project.dir)
+        self.__fixed_cache: dict[tuple[str, bool], str] = {}
+        self.__dotenv_loaded = False
+        # Environment values are resolved once per transformer, like the placeholder values
+        self.__environment: dict[str, str] = {}
+        self.__env_lookup = functools.partial(_replace_env, self.__environment)
+        self.__relative_values = self.__values(use_relative=True)
+        self.__absolute_values = self.__values(use_relative=False)
+        self.__relative_lookup = functools.partial(_fixed_value, self.__relative_values, self.__environment)
+        self.__absolute_lookup = functools.partial(_fixed_value, self.__absolute_values, self.__environment)
+        self.__relative_placeholder_lookup = functools.partial(_placeholder_value, self.__relative_values)
+        self.__absolute_placeholder_lookup = functools.partial(_placeholder_value, self.__absolute_values)
+        # Values that carry env placeholders need the env pass to run after they are inserted
+        self.__values_have_env = any(
+            "{{env:" in value
+            for values in (self.__relative_values, self.__absolute_values)
+            for value in values.values()
+        )
+
+    @property
+    def placeholders(self) -> Mapping[str, str]:
+        return MappingProxyType(self.__placeholder_map)
+
+    @property
+    def variables(self) -> Mapping[str, str]:
+        return MappingProxyType(self.__variables)
+
+    @property
+    def project(self) -> Project:
+        return self.__project.model_copy()
 
     def command(self, command: Command) -> Command:
-        prompt = self.__fixed(command.prompt)
-        prompt = self.__replacements(prompt, command.replacements)
+        prompt = self.__text(command.prompt, command.replacements)
 
         metadata = self.__dict(command.metadata, command.replacements)
 
-        return Command(
-            name=command.name,
-            description=command.description,
-            prompt=prompt,
-            metadata=metadata,
-            replacements=command.replacements,
-        )
+        return command.model_copy(update={"prompt": prompt, "metadata": metadata})
 
     def rule(self, rule: Rule) -> Rule:
-        title = self.__fixed(rule.description)
-        title = self.__replacements(title, rule.replacements)
-
-        prompt = self.__fixed(rule.prompt)
-        prompt = self.__replacements(prompt, rule.replacements)
+        title = self.__text(rule.description, rule.replacements)
+        prompt = self.__text(rule.prompt, rule.replacements)
 
         metadata = self.__dict(rule.metadata, rule.replacements)
 
-        return Rule(
-            name=rule.name,
-            description=title,
-            prompt=prompt,
-            metadata=metadata,
-            replacements=rule.replacements,
-        )
+        return rule.model_copy(update={"description": title, "prompt": prompt, "metadata": metadata})
 
     def subagent(self, subagent: Subagent) -> Subagent:
-        description = self.__fixed(subagent.description)
-        description = self.__replacements(description, subagent.replacements)
-
-        prompt = self.__fixed(subagent.prompt)
-        prompt = self.__replacements(prompt, subagent.replacements)
+        description = self.__text(subagent.description, subagent.replacements)
+        prompt = self.__text(subagent.prompt, subagent.replacements)
 
         metadata = self.__dict(subagent.metadata, subagent.replacements)
 
-        return Subagent(
-            name=subagent.name,
-            description=description,
-            prompt=prompt,
-            metadata=metadata,
-            replacements=subagent.replacements,
-        )
+        return subagent.model_copy(update={"description": description, "prompt": prompt, "metadata": metadata})
 
     def skill(self, skill: Skill) -> Skill:
-        description = self.__fixed(skill.description)
-        description = self.__replacements(description, skill.replacements)
-
-        prompt = self.__fixed(skill.prompt)
-        prompt = self.__replacements(prompt, skill.replacements)
+        description = self.__text(skill.description, skill.replacements)
+        prompt = self.__text(skill.prompt, skill.replacements)
 
         metadata = self.__dict(skill.metadata, skill.replacements)
 
-        return Skill(
-            name=skill.name,
-            description=description,
-            prompt=prompt,
-            metadata=metadata,
-            replacements=skill.replacements,
-            files=skill.files,
-        )
+        return skill.model_copy(update={"description": description, "prompt": prompt, "metadata": metadata})
 
     def mcp_server(self, mcp_server: MCPServer) -> MCPServer:
+        fixed = self.__fixed
         if isinstance(mcp_server, HttpMCPServer):
-            return HttpMCPServer(
-                name=mcp_server.name,
-                type=mcp_server.type,
-                url=self.__fixed(mcp_server.url),
-                headers={k: self.__fixed(v) for k, v in mcp_server.headers.items()},
+            return mcp_server.model_copy(
+                update={
+                    "url": fixed(mcp_server.url),
+                    "headers": {k: fixed(v) for k, v in mcp_server.headers.items()},
+                }
             )
 
-        return StdioMCPServer(
-            name=mcp_server.name,
-            type=mcp_server.type,
-            command=self.__fixed(mcp_server.command),
-            args=[self.__fixed(arg) for arg in mcp_server.args],
-            env={variable: self.__fixed(value) for variable, value in mcp_server.env.items()},
+        return mcp_server.model_copy(
+            update={
+                "command": fixed(mcp_server.command),
+                "args": [fixed(arg) for arg in mcp_server.args],
+                "env": {variable: fixed(value) for variable, value in mcp_server.env.items()},
+            }
         )
 
+    def __text(self, text: str, replacements: dict[str, ReplacementSpec]) -> str:
+        # Static text with no replacements to check is returned as is, without entering either pass
+        if not replacements and "{{" not in text:
+            return text
+
+        return self.__replacements(self.__fixed(text), replacements)
+
     def __fixed(self, text: str) -> str:
-        text = self.__static(text)
-        text = self.__var(text)
-        text = self.__env(text)
+        # Without "{{" neither pass can match, so skip building the placeholder values
+        if "{{" not in text:
+            return text
 
-        return text
+        if not self.__dotenv_loaded and (self.__values_have_env or "{{env:" in text):
+            self.__load_dotenv()
 
-    def __static(self, text: str) -> str:
         # Use relative paths if project_dir is the current working directory
-        cwd = os.path.abspath(os.getcwd())
-        project_dir_abs = os.path.abspath(self.project.dir)
-        use_relative = cwd == project_dir_abs
+        use_relative = os.path.abspath(os.getcwd()) == self.__project_dir_abs
+        cache_key = (text, use_relative)
+        cached = self.__fixed_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        if self.__values_have_env:
+            fixed = self.__env(self.__placeholders(text, use_relative))
+        else:
+            # Placeholders and env variables are resolved in a single pass over the text
+            lookup = self.__relative_lookup if use_relative else self.__absolute_lookup
+            fixed = _FIXED_RE.sub(lookup, text)
+
+        if len(self.__fixed_cache) < _FIXED_CACHE_SIZE:
+            self.__fixed_cache[cache_key] = fixed
+
+        return fixed
+
+    def __load_dotenv(self) -> None:
+        self.__dotenv_loaded = True
+
+        # Only runs once a text needs an env variable, so most transformations never touch the disk
+        env_file = os.path.join(self.__project.dir, ".env")
+        if os.path.isfile(env_file):
+            from dotenv import load_dotenv
+
+            load_dotenv(env_file, override=False)
 
-        merged = {
+    def __placeholders(self, text: str, use_relative: bool) -> str:
+        lookup = self.__relative_placeholder_lookup if use_relative else self.__absolute_placeholder_lookup
+
+        return _PLACEHOLDER_RE.sub(lookup, text)
+
+    def __values(self, use_relative: bool) -> dict[str, str]:
+        values = {
             "project_dir": ".",
-            "project_name": self.project.name,
-            "project_namespace": self.project.namespace or "",
-            **self.placeholders,
+            "project_name": self.__project.name,
+            "project_namespace": self.__project.namespace or "",
+            **self.__placeholder_map,
         }
 
         if not use_relative:
-            for key, value in merged.items():
+            for key, value in values.items():
                 if key.endswith("_dir") or key.endswith("_file"):
-                    merged[key] = self.project.dir + "/" + value
-            merged["project_dir"] = self.project.dir
-
-        for key, value in merged.items():
-            text = text.replace("{{" + key + "}}", value)
+                    values[key] = self.__project.dir + "/" + value
+            values["project_dir"] = self.__project.dir
 
-        return text
-
-    def __var(self, text: str) -> str:
-        for variable_name, variable_value in self.variables.items():
-            text = text.replace("{{var:" + variable_name + "}}", variable_value)
+        for variable_name, variable_value in self.__variables.items():
+            values["var:" + variable_name] = variable_value
 
-        return text
+        return values
 
     def __env(self, text: str) -> str:
-        pattern = r"\{\{env:([A-Za-z_][A-Za-z0-9_]*)\}\}"
+        # Most texts have no environment placeholders, and a substring check is far cheaper than the regex
+        if "{{env:" not in text:
+            return text
 
-        def replace_env(match: re.Match[str]) -> str:
-            var_name = match.group(1)
-            value = os.getenv(var_name)
+        names = set(_ENV_RE.findall(text))
+        if len(names) == 1:
+            # A literal replace skips the per-match callback and cannot re-expand the inserted value
+            (name,) = names
+            return text.replace("{{env:" + name + "}}", _env_value(self.__environment, name))
 
-            if value is None:
-                raise EnvironmentVariableNotFoundError(
-                    f"Environment variable '{var_name}' not found. Make sure it's set in your environment or .env file."
-                )
-
-            return value
-
-        return re.sub(pattern, replace_env, text)
+        return _ENV_RE.sub(self.__env_lookup, text)
 
     def __replacements(self, text: str, replacements: dict[str, ReplacementSpec]) -> str:
+        if not replacements:
+            return text
+
         for placeholder, spect in replacements.items():
             placeholder = "{{" + placeholder + "}}"
             if spect.type == "value":
                 text = text.replace(placeholder, str(spect.value))
                 continue
 
-            variable = self.variables.get(spect.discriminator)
+            variable = self.__variables.get(spect.discriminator)
             if variable is None:
                 raise VariableNotFoundError(f"Variable not found: {spect.discriminator}")
 
@@ -195,33 +264,14 @@ class PlaceholderTransformer:
         return text
 
     def __dict(self, original: dict[str, Any], replacements: dict[str, ReplacementSpec]) -> dict[str, Any]:
-        transformed: dict[str, Any] = {}
-        for key, value in original.items():
-            if isinstance(value, str):
-                transformed_value = self.__fixed(value)
-                transformed_value = self.__replacements(transformed_value, replacements)
-                transformed[key] = transformed_value
-            elif isinstance(value, dict):
-                transformed[key] = self.__dict(value, replacements)
-            elif isinstance(value, list):
-                transformed[key] = self.__list(value, replacements)
-            else:
-                transformed[key] = value
-
-        return transformed
-
-    def __list(self, original: list[Any], replacements: dict[str, ReplacementSpec]) -> list[Any]:
-        transformed: list[Any] = []
-        for item in original:
-            if isinstance(item, str):
-                transformed_value = self.__fixed(item)
-                transformed_value = self.__replacements(transformed_value, replacements)
-                transformed.append(transformed_value)
-            elif isinstance(item, dict):
-                transformed.append(self.__dict(item, replacements))
-            elif isinstance(item, list):
-                transformed.append(self.__list(item, replacements))
-            else:
-                transformed.append(item)
-
-        return transformed
+        return {key: self.__value(value, replacements) for key, value in original.items()}
+
+    def __value(self, value: Any, replacements: dict[str, ReplacementSpec]) -> Any:
+        if isinstance(value, str):
+            return self.__text(value, replacements)
+        if isinstance(value, dict):
+            return self.__dict(value, replacements)
+        if isinstance(value, list):
+            return [self.__value(item, replacements) for item in value]
+
+        return value
@@ -15,7 +15,7 @@ class RepositoryFetchError(Exception):
     pass
 
 
-@dataclass
+@dataclass(slots=True)
 class ParsedRepository:
     url: str
     version: str | None
@@ -1,3 +1,4 @@
+import functools
 from typing import Any, Literal
 
 from pydantic import BaseModel, Field, field_validator
@@ -16,6 +17,10 @@ class VariableSpec(BaseModel):
     choices: list[str] | None = Field(None, description="Available choices for the variable")
     default: str | None = Field(None, description="Default value")
 
+    @functools.cached_property
+    def choice_set(self) -> frozenset[str]:
+        return frozenset(self.choices or ())
+
 
 class StdioMCPServer(BaseModel):
     name: str = Field(..., description="Server name")
@@ -88,6 +93,18 @@ class Skill(BaseModel):
     )
 
 
+def _duplicate_names(items: list[Command] | list[Subagent] | list[Skill]) -> set[str]:
+    seen: set[str] = set()
+    duplicates: set[str] = set()
+    for item in items:
+        if item.name in seen:
+            duplicates.add(item.name)
+        else:
+            seen.add(item.name)
+
+    return duplicates
+
+
 class CharlieConfig(BaseModel):
     version: str = Field("1.0", description="Schema version")
     extends: list[str] = Field(
@@ -113,26 +130,23 @@ class CharlieConfig(BaseModel):
     @field_validator("commands")
     @classmethod
     def validate_unique_command_names(cls, v: list[Command]) -> list[Command]:
-        command_names = [cmd.name for cmd in v]
-        if len(command_names) != len(set(command_names)):
-            duplicate_names = [name for name in command_names if command_names.count(name) > 1]
-            raise ValueError(f"Duplicate command names found: {set(duplicate_names)}")
+        duplicate_names = _duplicate_names(v)
+        if duplicate_names:
+            raise ValueError(f"Duplicate command names found: {duplicate_names}")
         return v
 
     @field_validator("subagents")
     @classmethod
     def validate_unique_subagent_names(cls, v: list[Subagent]) -> list[Subagent]:
-        names = [s.name for s in v]
-        if len(names) != len(set(names)):
-            duplicate_names = [name for name in names if names.count(name) > 1]
-            raise ValueError(f"Duplicate subagent names found: {set(duplicate_names)}")
+        duplicate_names = _duplicate_names(v)
+        if duplicate_names:
+            raise ValueError(f"Duplicate subagent names found: {duplicate_names}")
         return v
 
     @field_validator("skills")
     @classmethod
     def validate_unique_skill_names(cls, v: list[Skill]) -> list[Skill]:
-        names = [s.name for s in v]
-        if len(names) != len(set(names)):
-            duplicate_names = [name for name in names if names.count(name) > 1]
-            raise ValueError(f"Duplicate skill names found: {set(duplicate_names)}")
+        duplicate_names = _duplicate_names(v)
+        if duplicate_names:
+            raise ValueError(f"Duplicate skill names found: {duplicate_names}")
         return v
@@ -2,13 +2,20 @@ from typing import Any
 
 
 class Tracker:
+    __slots__ = ("_records", "_snapshot")
+
     def __init__(self) -> None:
         self._records: list[dict[str, Any]] = []
+        self._snapshot: tuple[dict[str, Any], ...] | None = None
 
     def track(self, event: str, metadata: dict[str, Any] | None = None) -> None:
-        record = {**metadata, "event": event} if metadata else {"event": event}
+        record = dict(metadata, event=event) if metadata else {"event": event}
         self._records.append(record)
+        self._snapshot = None
 
     @property
-    def records(self) -> list[dict[str, Any]]:
-        return self._records.copy()
+    def records(self) -> tuple[dict[str, Any], ...]:
+        if self._snapshot is None:
+            self._snapshot = tuple(self._records)
+
+        return self._snapshot
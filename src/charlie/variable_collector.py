@@ -13,20 +13,23 @@ class VariableCollector:
         return collected
 
     def _collect_single(self, name: str, spec: VariableSpec | None) -> str:
-        value = None
-        if spec and spec.env:
-            value = os.environ.get(spec.env)
+        if spec is None:
+            return input(f"Enter value for {name}: ")
 
-        if not value and spec and spec.default:
+        env = spec.env
+        choices = spec.choices
+
+        value = os.environ.get(env) if env else None
+        if not value:
             value = spec.default
 
         if not value:
             prompt = f"Enter value for {name}"
-            if spec and spec.choices:
-                prompt += f" (choices: {', '.join(spec.choices)})"
+            if choices:
+                prompt += f" (choices: {', '.join(choices)})"
             value = input(prompt + ": ")
 
-        if spec and spec.choices and value not in spec.choices:
+        if choices and value not in spec.choice_set:
             raise ValueError(f"Invalid choice: {value}")
 
         return value
@@ -0,0 +1,85 @@
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from charlie.configurators.agent_configurator_factory import AgentConfiguratorFactory
+from charlie.configurators.claude_configurator import ClaudeConfigurator
+from charlie.configurators.copilot_configurator import CopilotConfigurator
+from charlie.configurators.cursor_configurator import CursorConfigurator
+from charlie.configurators.opencode_configurator import OpencodeConfigurator
+from charlie.schema import Project
+from charlie.tracker import Tracker
+
+
+@pytest.fixture
+def project(tmp_path: Path) -> Project:
+    return Project(name="test-project", namespace=None, dir=str(tmp_path))
+
+
+@pytest.mark.parametrize(
+    ("agent_name", "expected_class"),
+    [
+        ("claude", ClaudeConfigurator),
+        ("copilot", CopilotConfigurator),
+        ("cursor", CursorConfigurator),
+        ("opencode", OpencodeConfigurator),
+    ],
+)
+def test_should_create_configurator_when_agent_is_supported(
+    agent_name: str, expected_class: type, project: Project
+) -> None:
+    configurator = AgentConfiguratorFactory.create(agent_name, project, Tracker())
+
+    assert isinstance(configurator, expected_class)
+    assert configurator.placeholders()["agent_shortname"] == agent_name
+
+
+@pytest.mark.parametrize(
+    ("agent_name", "expected_class", "expected_short_name"),
+    [
+        ("Claude Code", ClaudeConfigurator, "claude"),
+        ("claude-code", ClaudeConfigurator, "claude"),
+        ("GitHub Copilot", CopilotConfigurator, "copilot"),
+        ("OpenCode", OpencodeConfigurator, "opencode"),
+    ],
+)
+def test_should_create_configurator_when_agent_name_is_an_alias(
+    agent_name: str, expected_class: type, expected_short_name: str, project: Project
+) -> None:
+    configurator = AgentConfiguratorFactory.create(agent_name, project, Tracker())
+
+    assert isinstance(configurator, expected_class)
+    assert configurator.placeholders()["agent_shortname"] == expected_short_name
+
+
+def test_should_raise_error_when_agent_is_not_supported(project: Project) -> None:
+    with pytest.raises(ValueError, match="Unsupported agent: unknown"):
+        AgentConfiguratorFactory.create("unknown", project, Tracker())
+
+
+def test_should_raise_error_when_agent_name_is_only_a_prefix(project: Project) -> None:
+    with pytest.raises(ValueError, match="Unsupported agent: co"):
+        AgentConfiguratorFactory.create("co", project, Tracker())
+
+
+def test_should_only_import_requested_configurator_when_creating_it(tmp_path: Path) -> None:
+    code = (
+        "import sys\n"
+        "from charlie.configurators.agent_configurator_factory import AgentConfiguratorFactory\n"
+        "from charlie.schema import Project\n"
+        "from charlie.tracker import Tracker\n"
+        f"AgentConfiguratorFactory.create('claude', Project(name='p', dir={str(tmp_path)!r}), Tracker())\n"
+        "print(sorted(name for name in sys.modules if name.endswith('_configurator')))"
+    )
+
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+
+    assert result.stdout.strip() == str(
+        ["charlie.configurators.agent_configurator", "charlie.configurators.claude_configurator"]
+    )
+
+
+def test_should_list_supported_agents_in_alphabetical_order() -> None:
+    assert AgentConfiguratorFactory.supported_agents() == ("claude", "copilot", "cursor", "opencode")
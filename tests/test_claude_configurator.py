@@ -1,4 +1,5 @@
 import json
+import shutil
 from pathlib import Path
 from unittest.mock import Mock
 
@@ -65,6 +66,22 @@ def test_should_create_skills_directory_when_generating_commands(
     assert skills_dir.is_dir()
 
 
+def test_should_write_files_again_when_output_directory_was_deleted_between_runs(
+    configurator: ClaudeConfigurator, project: Project
+) -> None:
+    commands = [Command(name="test", description="Test command", prompt="Test prompt")]
+    servers = [StdioMCPServer(name="server", command="node")]
+    configurator.commands(commands)
+    configurator.mcp_servers(servers)
+
+    shutil.rmtree(Path(project.dir) / ".claude")
+    configurator.commands(commands)
+    configurator.mcp_servers(servers)
+
+    assert (Path(project.dir) / ".claude/skills/test/SKILL.md").is_file()
+    assert (Path(project.dir) / ".claude/settings.local.json").is_file()
+
+
 def test_should_create_skill_file_when_processing_each_command(
     configurator: ClaudeConfigurator, project: Project
 ) -> None:
@@ -401,6 +418,21 @@ def test_should_track_rule_files_and_claude_md_when_using_separate_mode(
     assert any("CLAUDE.md" in str(f) for f in tracked_files)
 
 
+def test_should_track_unchanged_files_when_generating_same_rules_again(
+    configurator: ClaudeConfigurator, tracker: Mock, project: Project
+) -> None:
+    rules = [Rule(name="style", description="Style", prompt="Use Black")]
+    configurator.rules(rules, RuleMode.SEPARATE)
+    tracker.reset_mock()
+
+    configurator.rules(rules, RuleMode.SEPARATE)
+
+    assert [call.args[0] for call in tracker.track.call_args_list] == [
+        f"Unchanged {Path(project.dir) / '.claude/rules/style.md'}",
+        f"Unchanged {Path(project.dir) / 'CLAUDE.md'}",
+    ]
+
+
 def test_should_return_early_when_no_mcp_servers_provided(configurator: ClaudeConfigurator, tracker: Mock) -> None:
     configurator.mcp_servers([])
 
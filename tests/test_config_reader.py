@@ -1,4 +1,8 @@
+import subprocess
+import sys
+
 import pytest
+from pydantic import ValidationError
 
 from charlie.config_reader import (
     ConfigParseError,
@@ -10,7 +14,7 @@ from charlie.config_reader import (
     parse_frontmatter,
     parse_single_file,
 )
-from charlie.schema import Command
+from charlie.schema import Command, MCPServer
 
 
 def test_parse_valid_config_with_project_and_commands(tmp_path) -> None:
@@ -98,6 +102,38 @@ def test_find_config_not_found_returns_none(tmp_path) -> None:
     assert found is None
 
 
+def test_should_find_dist_config_when_main_config_is_missing(tmp_path) -> None:
+    dist = tmp_path / "charlie.dist.yaml"
+    dist.write_text("dist")
+    (tmp_path / ".charlie").mkdir()
+
+    assert find_config_file(tmp_path) == dist
+
+
+def test_should_find_charlie_directory_when_no_config_file_exists(tmp_path) -> None:
+    (tmp_path / ".charlie").mkdir()
+
+    assert find_config_file(tmp_path) == tmp_path / ".charlie"
+
+
+def test_should_ignore_charlie_file_when_it_is_not_a_directory(tmp_path) -> None:
+    (tmp_path / ".charlie").write_text("not a directory")
+
+    assert find_config_file(tmp_path) is None
+
+
+def test_should_return_none_when_start_directory_does_not_exist(tmp_path) -> None:
+    assert find_config_file(tmp_path / "missing") is None
+
+
+def test_should_return_absolute_path_when_start_directory_is_relative(tmp_path, monkeypatch) -> None:
+    (tmp_path / "project").mkdir()
+    (tmp_path / "project" / "charlie.yaml").write_text("test")
+    monkeypatch.chdir(tmp_path)
+
+    assert find_config_file("project") == tmp_path.resolve() / "project" / "charlie.yaml"
+
+
 def test_parse_config_with_mcp_servers(tmp_path) -> None:
     config_file = tmp_path / "config.yaml"
     config_file.write_text(
@@ -133,6 +169,19 @@ def test_parse_single_file_invalid_raises_config_parse_error(tmp_path) -> None:
         parse_single_file(invalid_file, Command)
 
 
+def test_should_list_each_field_error_and_chain_cause_when_validation_fails(tmp_path) -> None:
+    invalid_file = tmp_path / "invalid.yaml"
+    invalid_file.write_text("name: test\n")
+
+    with pytest.raises(ConfigParseError) as error:
+        parse_single_file(invalid_file, Command)
+
+    assert f"Validation failed for {invalid_file}:\n  description: Field required\n  prompt: Field required" in str(
+        error.value
+    )
+    assert isinstance(error.value.__cause__, ValidationError)
+
+
 def test_discover_config_files_empty_when_charlie_dir_not_exist(tmp_path) -> None:
     result = discover_charlie_files(tmp_path)
     assert result["commands"] == []
@@ -161,6 +210,18 @@ def test_discover_config_files_complete_directory_structure(tmp_path) -> None:
     assert len(result["mcp_servers"]) == 1
 
 
+def test_should_discover_mcp_servers_with_either_yaml_extension_when_scanning_directory(tmp_path) -> None:
+    mcp_dir = tmp_path / ".charlie" / "mcp-servers"
+    mcp_dir.mkdir(parents=True)
+    (mcp_dir / "b.yml").write_text("test")
+    (mcp_dir / "a.yaml").write_text("test")
+    (mcp_dir / "notes.txt").write_text("test")
+
+    result = discover_charlie_files(tmp_path)
+
+    assert result["mcp_servers"] == [mcp_dir / "a.yaml", mcp_dir / "b.yml"]
+
+
 def test_load_directory_config_minimal_with_inferred_project_name(tmp_path) -> None:
     charlie_dir = tmp_path / ".charlie"
     commands_dir = charlie_dir / "commands"
@@ -751,3 +812,159 @@ B
 
         assert result is not None
         assert result.project.name in ["config-a", "config-b"]
+
+
+def test_should_return_independent_copies_when_parsing_same_file_twice(tmp_path) -> None:
+    command_file = tmp_path / "deploy.md"
+    command_file.write_text("---\ndescription: Deploy\n---\n\nDeploy it")
+
+    first = parse_single_file(command_file, Command)
+    first.metadata["changed"] = True
+    second = parse_single_file(command_file, Command)
+
+    assert second.prompt == "Deploy it"
+    assert second.metadata == {}
+
+
+def test_should_parse_file_again_when_its_content_changes(tmp_path) -> None:
+    command_file = tmp_path / "deploy.md"
+    command_file.write_text("---\ndescription: Deploy\n---\n\nDeploy it")
+    parse_single_file(command_file, Command)
+
+    command_file.write_text("---\ndescription: Deploy now\n---\n\nDeploy it right now")
+
+    assert parse_single_file(command_file, Command).description == "Deploy now"
+
+
+def test_should_keep_horizontal_rules_in_body_when_parsing_frontmatter() -> None:
+    content = "---\nname: test\n---\n\nIntro\n\n---\n\nOutro"
+
+    frontmatter, body = parse_frontmatter(content)
+
+    assert frontmatter == {"name": "test"}
+    assert body == "Intro\n\n---\n\nOutro"
+
+
+def test_should_not_import_yaml_when_importing_config_reader() -> None:
+    code = "import sys\nimport charlie.config_reader\nprint('yaml' in sys.modules)"
+
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+
+    assert result.stdout.strip() == "False"
+
+
+def test_should_load_commands_in_file_order_when_directory_has_many_commands(tmp_path) -> None:
+    commands_dir = tmp_path / ".charlie" / "commands"
+    commands_dir.mkdir(parents=True)
+    for index in range(12):
+        (commands_dir / f"command-{index:02}.md").write_text(f"---\ndescription: Command {index}\n---\n\nRun {index}")
+
+    config = load_directory_config(tmp_path)
+
+    assert [command.name for command in config.commands] == [f"command-{index:02}" for index in range(12)]
+
+
+def test_should_report_failing_file_when_directory_has_many_commands(tmp_path) -> None:
+    commands_dir = tmp_path / ".charlie" / "commands"
+    commands_dir.mkdir(parents=True)
+    for index in range(12):
+        (commands_dir / f"command-{index:02}.md").write_text(f"---\ndescription: Command {index}\n---\n\nRun {index}")
+    (commands_dir / "command-05.md").write_text("   ")
+
+    with pytest.raises(ConfigParseError, match="Error loading command from .*command-05.md"):
+        load_directory_config(tmp_path)
+
+
+@pytest.mark.parametrize(
+    ("content", "expected_body"),
+    [
+        ("\n\n  ---\nname: test\n---\n\nBody", "Body"),
+        ("\n\n  Just plain content", "Just plain content"),
+    ],
+)
+def test_should_ignore_leading_whitespace_when_parsing_frontmatter(content: str, expected_body: str) -> None:
+    _, body = parse_frontmatter(content)
+
+    assert body == expected_body
+
+
+def test_should_parse_each_mcp_server_file_when_several_share_the_union_type(tmp_path) -> None:
+    first = tmp_path / "first.yaml"
+    first.write_text("command: node\n")
+    second = tmp_path / "second.yaml"
+    second.write_text("type: http\nurl: https://example.com/mcp\n")
+
+    assert parse_single_file(first, MCPServer).name == "first"  # type: ignore[arg-type]
+    assert parse_single_file(second, MCPServer).name == "second"  # type: ignore[arg-type]
+
+
+def test_should_return_independent_copies_when_parsing_same_config_twice(tmp_path) -> None:
+    config_file = tmp_path / "charlie.yaml"
+    config_file.write_text(
+        "project:\n  name: cached\ncommands:\n  - name: init\n    description: Init\n    prompt: Go\n"
+    )
+
+    first = parse_config(config_file)
+    first.commands.clear()
+    second = parse_config(config_file)
+
+    assert second.project is not None
+    assert second.project.name == "cached"
+    assert [command.name for command in second.commands] == ["init"]
+
+
+def test_should_parse_config_again_when_a_directory_file_is_added(tmp_path) -> None:
+    commands_dir = tmp_path / ".charlie" / "commands"
+    commands_dir.mkdir(parents=True)
+    (commands_dir / "first.md").write_text("---\ndescription: First\n---\n\nFirst")
+    parse_config(tmp_path)
+
+    (commands_dir / "second.md").write_text("---\ndescription: Second\n---\n\nSecond")
+
+    assert [command.name for command in parse_config(tmp_path).commands] == ["first", "second"]
+
+
+def test_should_keep_each_category_separate_when_parsing_many_files_together(tmp_path) -> None:
+    charlie_dir = tmp_path / ".charlie"
+    for directory, prefix in (("commands", "command"), ("rules", "rule"), ("agents", "agent")):
+        (charlie_dir / directory).mkdir(parents=True)
+        for index in range(3):
+            (charlie_dir / directory / f"{prefix}-{index}.md").write_text(
+                f"---\ndescription: {prefix} {index}\n---\n\nBody"
+            )
+
+    config = load_directory_config(tmp_path)
+
+    assert [command.name for command in config.commands] == ["command-0", "command-1", "command-2"]
+    assert [rule.name for rule in config.rules] == ["rule-0", "rule-1", "rule-2"]
+    assert [subagent.name for subagent in config.subagents] == ["agent-0", "agent-1", "agent-2"]
+
+
+def test_should_parse_yaml_with_byte_order_mark_when_reading_config(tmp_path) -> None:
+    config_file = tmp_path / "charlie.yaml"
+    config_file.write_bytes("\ufeffproject:\n  name: café\n".encode())
+
+    config = parse_config(config_file)
+
+    assert config.project is not None
+    assert config.project.name == "café"
+
+
+def test_should_skip_directories_with_dots_when_discovering_assets(tmp_path) -> None:
+    assets_dir = tmp_path / ".charlie" / "assets"
+    (assets_dir / "v1.0").mkdir(parents=True)
+    (assets_dir / "v1.0" / "logo.png").write_text("png")
+
+    result = discover_charlie_files(tmp_path)
+
+    assert result["assets"] == [assets_dir / "v1.0" / "logo.png"]
+
+
+def test_should_not_import_slugify_or_thread_pool_when_importing_config_reader() -> None:
+    code = (
+        "import sys\nimport charlie.config_reader\nprint('slugify' in sys.modules, 'concurrent.futures' in sys.modules)"
+    )
+
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+
+    assert result.stdout.strip() == "False False"
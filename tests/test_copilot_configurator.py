@@ -518,3 +518,29 @@ def test_should_track_skip_message_when_ignore_file_called_for_copilot(
     call_args = tracker.track.call_args[0][0]
     assert "GitHub Copilot does not support ignore files" in call_args
     assert "Skipping" in call_args
+
+
+def test_should_track_files_in_input_order_when_creating_many_commands(
+    configurator: CopilotConfigurator, tracker: Mock, project: Project
+) -> None:
+    commands = [Command(name=f"command-{index:02d}", description="Run", prompt="Run") for index in range(12)]
+
+    configurator.commands(commands)
+
+    prompts_dir = Path(project.dir) / ".github/prompts"
+    assert [call.args[0] for call in tracker.track.call_args_list[:-1]] == [
+        f"Created {prompts_dir / f'command-{index:02d}.prompt.md'}" for index in range(12)
+    ]
+
+
+def test_should_track_rule_files_in_input_order_when_using_separate_mode_with_many_rules(
+    configurator: CopilotConfigurator, tracker: Mock, project: Project
+) -> None:
+    rules = [Rule(name=f"rule-{index:02d}", description="Rule", prompt="Follow") for index in range(12)]
+
+    configurator.rules(rules, RuleMode.SEPARATE)
+
+    rules_dir = Path(project.dir) / ".github/instructions"
+    assert [call.args[0] for call in tracker.track.call_args_list[:-1]] == [
+        f"Created {rules_dir / f'rule-{index:02d}-instructions.md'}" for index in range(12)
+    ]
@@ -185,6 +185,19 @@ def test_should_track_each_file_when_creating_commands(
     assert any("build.md" in str(f) for f in tracked_files)
 
 
+def test_should_track_files_in_input_order_when_creating_many_commands(
+    configurator: CursorConfigurator, tracker: Mock, project: Project
+) -> None:
+    commands = [Command(name=f"command-{index:02d}", description="Run", prompt="Run") for index in range(12)]
+
+    configurator.commands(commands)
+
+    commands_dir = Path(project.dir) / ".cursor/commands"
+    assert [call.args[0] for call in tracker.track.call_args_list] == [
+        f"Created {commands_dir / f'command-{index:02d}.md'}" for index in range(12)
+    ]
+
+
 def test_should_filter_custom_metadata_when_not_in_allowed_list(
     configurator: CursorConfigurator, project: Project
 ) -> None:
@@ -0,0 +1,215 @@
+import json
+import os
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from charlie import filesystem
+from charlie.filesystem import ensure_directory, read_bytes, read_json, write_json, write_text
+
+
+def test_should_create_directory_when_it_does_not_exist(tmp_path: Path) -> None:
+    directory = tmp_path / "a" / "b" / "c"
+
+    ensure_directory(directory)
+
+    assert directory.is_dir()
+
+
+def test_should_not_fail_when_directory_already_exists(tmp_path: Path) -> None:
+    directory = tmp_path / "existing"
+    directory.mkdir()
+
+    ensure_directory(directory)
+    ensure_directory(directory)
+
+    assert directory.is_dir()
+
+
+@pytest.mark.parametrize("content", [b"", b"name: test\n", bytes(range(256)) * 1024])
+def test_should_read_whole_file_when_reading_bytes(tmp_path: Path, content: bytes) -> None:
+    file = tmp_path / "file.bin"
+    file.write_bytes(content)
+
+    assert read_bytes(file) == content
+
+
+def test_should_read_past_reported_size_when_file_is_larger_than_stat_says(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    file = tmp_path / "file.bin"
+    file.write_bytes(b"x" * 100_000)
+    monkeypatch.setattr(filesystem.os, "fstat", lambda fd: os.stat_result((0,) * 10))
+
+    assert read_bytes(file) == b"x" * 100_000
+
+
+def test_should_recreate_directory_when_it_was_deleted_after_being_ensured(tmp_path: Path) -> None:
+    directory = tmp_path / "output"
+    ensure_directory(directory)
+    directory.rmdir()
+
+    ensure_directory(directory)
+    write_text(directory / "file.md", "content")
+
+    assert (directory / "file.md").read_text() == "content"
+
+
+def test_should_create_relative_directory_in_current_directory_when_working_directory_changes(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    (tmp_path / "first").mkdir()
+    (tmp_path / "second").mkdir()
+
+    monkeypatch.chdir(tmp_path / "first")
+    ensure_directory(Path("output"))
+    monkeypatch.chdir(tmp_path / "second")
+    ensure_directory(Path("output"))
+
+    assert (tmp_path / "second" / "output").is_dir()
+
+
+def test_should_write_all_parts_when_writing_text(tmp_path: Path) -> None:
+    file = tmp_path / "file.md"
+
+    write_text(file, "---\nname: café\n---\n\n", "", "Body")
+
+    assert file.read_text(encoding="utf-8") == "---\nname: café\n---\n\nBody"
+
+
+def test_should_truncate_existing_file_when_writing_text(tmp_path: Path) -> None:
+    file = tmp_path / "file.md"
+    file.write_text("A much longer previous content")
+
+    write_text(file, "Short")
+
+    assert file.read_text() == "Short"
+
+
+def test_should_create_empty_file_when_writing_no_parts(tmp_path: Path) -> None:
+    file = tmp_path / "empty.md"
+
+    write_text(file)
+
+    assert file.read_text() == ""
+
+
+def test_should_write_indented_json_with_trailing_newline_when_writing_json(tmp_path: Path) -> None:
+    file = tmp_path / "config.json"
+
+    write_json(file, {"servers": ["a"]})
+
+    assert file.read_text() == '{\n  "servers": [\n    "a"\n  ]\n}\n'
+
+
+def test_should_not_rewrite_file_when_content_is_unchanged(tmp_path: Path) -> None:
+    file = tmp_path / "file.md"
+    write_text(file, "Same content")
+    os.utime(file, ns=(0, 0))
+
+    write_text(file, "Same ", "content")
+
+    assert file.stat().st_mtime_ns == 0
+
+
+def test_should_report_whether_file_was_written_when_writing_text(tmp_path: Path) -> None:
+    file = tmp_path / "file.md"
+
+    assert write_text(file, "Content") is True
+    assert write_text(file, "Content") is False
+    assert write_text(file, "Changed") is True
+
+
+@pytest.mark.parametrize("has_orjson", [True, False])
+def test_should_report_whether_file_was_written_when_writing_json(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, has_orjson: bool
+) -> None:
+    monkeypatch.setattr(filesystem, "_HAS_ORJSON", has_orjson)
+    file = tmp_path / "config.json"
+
+    assert write_json(file, {"servers": ["a"]}) is True
+    assert write_json(file, {"servers": ["a"]}) is False
+
+
+def test_should_rewrite_file_when_content_has_same_size(tmp_path: Path) -> None:
+    file = tmp_path / "file.md"
+    write_text(file, "Old content")
+
+    write_text(file, "New content")
+
+    assert file.read_text() == "New content"
+
+
+@pytest.mark.parametrize("has_orjson", [True, False])
+def test_should_write_same_json_when_orjson_is_available_or_not(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, has_orjson: bool
+) -> None:
+    monkeypatch.setattr(filesystem, "_HAS_ORJSON", has_orjson)
+    file = tmp_path / "config.json"
+
+    write_json(file, {"mcpServers": {"server": {"command": "node", "args": ["a"], "env": {}}}})
+
+    assert file.read_text() == (
+        '{\n  "mcpServers": {\n    "server": {\n      "command": "node",\n'
+        '      "args": [\n        "a"\n      ],\n      "env": {}\n    }\n  }\n}\n'
+    )
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        {"name": "café", "emoji": "🚀", "control": "a\tb\u0001\u007f", "café": "key"},
+        {"ratio": 0.1, "whole": 1.0, "negative": -0.0, "big": 1e16, "small": 1e-07, "huge": [1.5e300]},
+        {"values": [float("nan"), float("inf")], 1: "integer key", "large": 2**70},
+    ],
+)
+def test_should_write_identical_bytes_when_orjson_is_available_or_not(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, data: dict[Any, Any]
+) -> None:
+    with_orjson = tmp_path / "with-orjson.json"
+    without_orjson = tmp_path / "without-orjson.json"
+
+    monkeypatch.setattr(filesystem, "_HAS_ORJSON", True)
+    write_json(with_orjson, data)
+    monkeypatch.setattr(filesystem, "_HAS_ORJSON", False)
+    write_json(without_orjson, data)
+
+    baseline = (json.dumps(data, indent=2) + "\n").encode()
+    assert with_orjson.read_bytes() == baseline
+    assert without_orjson.read_bytes() == baseline
+
+
+@pytest.mark.parametrize("has_orjson", [True, False])
+def test_should_escape_non_ascii_characters_when_writing_json(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, has_orjson: bool
+) -> None:
+    monkeypatch.setattr(filesystem, "_HAS_ORJSON", has_orjson)
+    file = tmp_path / "config.json"
+
+    write_json(file, {"name": "café"})
+
+    assert file.read_bytes() == b'{\n  "name": "caf\\u00e9"\n}\n'
+
+
+@pytest.mark.parametrize("has_orjson", [True, False])
+def test_should_read_json_when_orjson_is_available_or_not(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, has_orjson: bool
+) -> None:
+    monkeypatch.setattr(filesystem, "_HAS_ORJSON", has_orjson)
+    file = tmp_path / "config.json"
+    file.write_text('{"name": "café", "servers": [1, true, null]}', encoding="utf-8")
+
+    assert read_json(file) == {"name": "café", "servers": [1, True, None]}
+
+
+@pytest.mark.parametrize("has_orjson", [True, False])
+def test_should_raise_json_decode_error_when_json_is_invalid(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, has_orjson: bool
+) -> None:
+    monkeypatch.setattr(filesystem, "_HAS_ORJSON", has_orjson)
+    file = tmp_path / "config.json"
+    file.write_text("{invalid")
+
+    with pytest.raises(json.JSONDecodeError):
+        read_json(file)
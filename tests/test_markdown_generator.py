@@ -0,0 +1,165 @@
+import subprocess
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+from charlie import markdown_generator
+from charlie.markdown_generator import MarkdownDocument, MarkdownGenerator
+
+
+@pytest.fixture
+def generator() -> MarkdownGenerator:
+    return MarkdownGenerator()
+
+
+def test_should_write_body_only_when_metadata_is_not_provided(generator: MarkdownGenerator, tmp_path: Path) -> None:
+    file = tmp_path / "plain.md"
+
+    generator.generate(file=file, body="Hello")
+
+    assert file.read_text() == "Hello"
+
+
+def test_should_write_frontmatter_when_metadata_is_provided(generator: MarkdownGenerator, tmp_path: Path) -> None:
+    file = tmp_path / "with-metadata.md"
+
+    generator.generate(file=file, body="Hello", metadata={"description": "Greeting"})
+
+    assert file.read_text() == "---\ndescription: Greeting\n---\n\nHello"
+
+
+def test_should_filter_metadata_to_allowed_fields_when_allowed_metadata_is_provided(
+    generator: MarkdownGenerator, tmp_path: Path
+) -> None:
+    file = tmp_path / "filtered.md"
+
+    generator.generate(
+        file=file,
+        body="Hello",
+        metadata={"description": "Greeting", "internal": "secret"},
+        allowed_metadata=["description"],
+    )
+
+    assert "internal" not in file.read_text()
+
+
+@pytest.mark.parametrize("count", [1, 2, 10])
+def test_should_write_every_document_when_generating_all(
+    generator: MarkdownGenerator, tmp_path: Path, count: int
+) -> None:
+    documents = [
+        MarkdownDocument(file=tmp_path / f"doc-{index}.md", body=f"Body {index}", metadata={"name": f"doc-{index}"})
+        for index in range(count)
+    ]
+
+    generator.generate_all(documents)
+
+    for index in range(count):
+        assert (tmp_path / f"doc-{index}.md").read_text() == f"---\nname: doc-{index}\n---\n\nBody {index}"
+
+
+def test_should_write_last_document_once_when_documents_share_a_path(
+    generator: MarkdownGenerator, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    written: list[Path] = []
+    write_text = markdown_generator.write_text
+    monkeypatch.setattr(
+        markdown_generator,
+        "write_text",
+        lambda file, *parts, **kwargs: written.append(file) or write_text(file, *parts, **kwargs),
+    )
+    documents = [
+        MarkdownDocument(file=tmp_path / "shared.md", body="First"),
+        MarkdownDocument(file=tmp_path / "other.md", body="Other"),
+        MarkdownDocument(file=tmp_path / "another.md", body="Another"),
+        MarkdownDocument(file=tmp_path / "shared.md", body="Last"),
+    ]
+
+    generator.generate_all(documents)
+
+    assert sorted(written) == [tmp_path / "another.md", tmp_path / "other.md", tmp_path / "shared.md"]
+    assert (tmp_path / "shared.md").read_text() == "Last"
+
+
+@pytest.mark.parametrize("count", [1, 10])
+def test_should_report_each_document_when_generating_all(
+    generator: MarkdownGenerator, tmp_path: Path, count: int
+) -> None:
+    documents = [MarkdownDocument(file=tmp_path / f"doc-{index}.md", body=f"Body {index}") for index in range(count)]
+    generated: list[tuple[MarkdownDocument, bool]] = []
+
+    generator.generate_all(documents, lambda document, written: generated.append((document, written)))
+
+    assert generated == [(document, True) for document in documents]
+
+
+def test_should_report_written_documents_when_another_document_fails(
+    generator: MarkdownGenerator, tmp_path: Path
+) -> None:
+    documents = [MarkdownDocument(file=tmp_path / f"doc-{index}.md", body=f"Body {index}") for index in range(4)]
+    failing = MarkdownDocument(file=tmp_path / "missing" / "doc.md", body="Body")
+    generated: list[tuple[MarkdownDocument, bool]] = []
+
+    with pytest.raises(FileNotFoundError):
+        generator.generate_all([*documents, failing], lambda document, written: generated.append((document, written)))
+
+    assert generated == [(document, True) for document in documents]
+
+
+def test_should_report_documents_in_input_order_when_later_documents_finish_first(
+    generator: MarkdownGenerator, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    write_text = markdown_generator.write_text
+    last_written = threading.Event()
+
+    def write_last_first(file: Path, *parts: str, **kwargs: str) -> bool:
+        if file.name != "doc-4.md":
+            last_written.wait(timeout=5)
+        written = write_text(file, *parts, **kwargs)
+        if file.name == "doc-4.md":
+            last_written.set()
+
+        return written
+
+    monkeypatch.setattr(markdown_generator, "write_text", write_last_first)
+    documents = [MarkdownDocument(file=tmp_path / f"doc-{index}.md", body=f"Body {index}") for index in range(5)]
+    generated: list[tuple[MarkdownDocument, bool]] = []
+
+    generator.generate_all(documents, lambda document, written: generated.append((document, written)))
+
+    assert generated == [(document, True) for document in documents]
+
+
+@pytest.mark.parametrize("count", [1, 10])
+def test_should_report_unchanged_documents_when_generating_all_again(
+    generator: MarkdownGenerator, tmp_path: Path, count: int
+) -> None:
+    documents = [MarkdownDocument(file=tmp_path / f"doc-{index}.md", body=f"Body {index}") for index in range(count)]
+    generator.generate_all(documents)
+    generated: list[tuple[MarkdownDocument, bool]] = []
+
+    generator.generate_all(documents, lambda document, written: generated.append((document, written)))
+
+    assert generated == [(document, False) for document in documents]
+
+
+def test_should_do_nothing_when_generating_all_without_documents(generator: MarkdownGenerator, tmp_path: Path) -> None:
+    generator.generate_all([])
+
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_should_not_import_yaml_when_writing_markdown_without_metadata(tmp_path: Path) -> None:
+    code = (
+        "import sys\n"
+        "from pathlib import Path\n"
+        "from charlie.markdown_generator import MarkdownGenerator\n"
+        f"MarkdownGenerator().generate(file=Path({str(tmp_path / 'plain.md')!r}), body='Hello')\n"
+        "print('yaml' in sys.modules)"
+    )
+
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+
+    assert result.stdout.strip() == "False"
@@ -1,12 +1,13 @@
 import json
 from pathlib import Path
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 import pytest
 
 from charlie.assets_manager import AssetsManager
 from charlie.configurators.opencode_configurator import OpencodeConfigurator
 from charlie.enums import RuleMode
+from charlie.filesystem import read_json
 from charlie.markdown_generator import MarkdownGenerator
 from charlie.schema import Command, HttpMCPServer, Project, Rule, Skill, StdioMCPServer, Subagent
 
@@ -616,3 +617,56 @@ def test_should_return_opencode_placeholders(configurator: OpencodeConfigurator)
     assert placeholders["subagents_dir"] == ".opencode/agents"
     assert placeholders["mcp_file"] == "opencode.json"
     assert placeholders["assets_dir"] == ".opencode/assets"
+
+
+def test_should_keep_instructions_and_mcp_servers_when_both_are_written(
+    configurator: OpencodeConfigurator, project: Project
+) -> None:
+    rules = [Rule(name="style", description="Style", prompt="Use tabs")]
+    configurator.rules(rules, RuleMode.SEPARATE)
+    configurator.mcp_servers([StdioMCPServer(name="server", command="node")])
+
+    config = json.loads((Path(project.dir) / "opencode.json").read_text())
+
+    assert config["instructions"] == [".opencode/instructions/style.md"]
+    assert "server" in config["mcp"]
+
+
+def test_should_read_opencode_json_once_when_writing_rules_and_mcp_servers(
+    configurator: OpencodeConfigurator, project: Project
+) -> None:
+    config_file = Path(project.dir) / "opencode.json"
+    config_file.write_text(json.dumps({"theme": "dark"}))
+    rules = [Rule(name="style", description="Style", prompt="Use tabs")]
+
+    with patch("charlie.configurators.opencode_configurator.read_json", wraps=read_json) as load:
+        configurator.rules(rules, RuleMode.SEPARATE)
+        configurator.mcp_servers([StdioMCPServer(name="server", command="node")])
+
+    assert load.call_count == 1
+    assert json.loads(config_file.read_text())["theme"] == "dark"
+
+
+def test_should_track_rule_files_in_input_order_when_using_separate_mode_with_many_rules(
+    configurator: OpencodeConfigurator, tracker: Mock, project: Project
+) -> None:
+    rules = [Rule(name=f"rule-{index:02d}", description="Rule", prompt="Follow") for index in range(12)]
+
+    configurator.rules(rules, RuleMode.SEPARATE)
+
+    rules_dir = Path(project.dir) / ".opencode/instructions"
+    assert [call.args[0] for call in tracker.track.call_args_list[:-1]] == [
+        f"Created {rules_dir / f'rule-{index:02d}.md'}" for index in range(12)
+    ]
+
+
+def test_should_track_unchanged_opencode_json_when_adding_same_mcp_servers_again(
+    configurator: OpencodeConfigurator, tracker: Mock, project: Project
+) -> None:
+    servers = [StdioMCPServer(name="server", command="node")]
+    configurator.mcp_servers(servers)
+    tracker.reset_mock()
+
+    configurator.mcp_servers(servers)
+
+    tracker.track.assert_called_once_with(f"Unchanged {Path(project.dir) / 'opencode.json'}")
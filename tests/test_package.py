@@ -0,0 +1,88 @@
+import subprocess
+import sys
+
+import pytest
+
+import charlie
+
+
+def _run_python(code: str) -> str:
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return result.stdout.strip()
+
+
+def test_should_not_import_submodules_when_importing_package() -> None:
+    output = _run_python("import sys, charlie; print('charlie.placeholder_transformer' in sys.modules)")
+
+    assert output == "False"
+
+
+def test_should_import_submodule_when_export_is_accessed() -> None:
+    output = _run_python(
+        "import sys, charlie; charlie.Tracker; print('charlie.tracker' in sys.modules, 'charlie.schema' in sys.modules)"
+    )
+
+    assert output == "True False"
+
+
+def test_should_import_submodules_when_eager_import_is_enabled(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("CHARLIE_EAGER_IMPORT", "1")
+
+    output = _run_python("import sys, charlie; print('charlie.placeholder_transformer' in sys.modules)")
+
+    assert output == "True"
+
+
+def test_should_resolve_exports_when_accessed() -> None:
+    from charlie.tracker import Tracker
+
+    assert charlie.Tracker is Tracker
+
+
+def test_should_resolve_schema_exports_when_imported_from_package() -> None:
+    from charlie import Command
+    from charlie.schema import Command as SchemaCommand
+
+    assert Command is SchemaCommand
+
+
+def test_should_not_import_schema_when_only_tracker_is_accessed() -> None:
+    output = _run_python("import sys; from charlie import Tracker; print('charlie.schema' in sys.modules)")
+
+    assert output == "False"
+
+
+def test_should_raise_attribute_error_when_export_is_unknown() -> None:
+    with pytest.raises(AttributeError, match="has no attribute 'Unknown'"):
+        charlie.Unknown
+
+
+def test_should_list_public_exports_when_calling_dir() -> None:
+    assert dir(charlie) == sorted(charlie.__all__)
+
+
+def test_should_not_read_package_metadata_when_importing_package() -> None:
+    output = _run_python(
+        "import importlib.metadata\n"
+        "def fail(name): raise RuntimeError(name)\n"
+        "importlib.metadata.version = fail\n"
+        "import charlie\n"
+        "print(bool(charlie.__version__))"
+    )
+
+    assert output == "True"
+
+
+def test_should_not_resolve_version_when_version_is_not_accessed() -> None:
+    output = _run_python("import sys, charlie; print('charlie._version' in sys.modules)")
+
+    assert output == "False"
+
+
+def test_should_return_same_version_when_accessed_repeatedly() -> None:
+    assert charlie.__version__ is charlie.__version__
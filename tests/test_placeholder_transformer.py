@@ -200,6 +200,36 @@ class TestStaticPlaceholders:
 
         assert result.prompt == "my-project - my-project - my-project"
 
+    def test_should_return_text_unchanged_when_it_has_no_placeholder_braces(
+        self, transformer: PlaceholderTransformer, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(os, "getcwd", lambda: pytest.fail("placeholder values should not be built"))
+        command = Command(name="test", description="Plain {project_name}", prompt="Plain {project_name}")
+
+        result = transformer.command(command)
+
+        assert result.prompt == "Plain {project_name}"
+
+    def test_should_follow_working_directory_when_same_text_is_transformed_again(
+        self, sample_placeholders: dict[str, str], sample_variables: dict[str, str], tmp_path: Path
+    ) -> None:
+        project = Project(name="test-project", namespace="test", dir=str(tmp_path))
+        transformer = PlaceholderTransformer(
+            placeholders=sample_placeholders, variables=sample_variables, project=project
+        )
+        command = Command(name="test", description="test", prompt="Dir: {{agent_dir}}")
+
+        original_cwd = os.getcwd()
+        try:
+            os.chdir(tmp_path)
+            relative = transformer.command(command)
+        finally:
+            os.chdir(original_cwd)
+        absolute = transformer.command(command)
+
+        assert relative.prompt == "Dir: .cursor"
+        assert absolute.prompt == f"Dir: {tmp_path}/.cursor"
+
 
 class TestVariablePlaceholders:
     def test_should_replace_variable_placeholders_when_variables_exist(
@@ -233,6 +263,49 @@ class TestVariablePlaceholders:
 
         assert result.prompt == "Language: {{var:language}}"
 
+    def test_should_keep_placeholders_inside_variable_values_literal_when_transforming(
+        self, sample_placeholders: dict[str, str], sample_project: Project
+    ) -> None:
+        transformer = PlaceholderTransformer(
+            placeholders=sample_placeholders, variables={"greeting": "{{project_name}}"}, project=sample_project
+        )
+        command = Command(name="test", description="test", prompt="{{var:greeting}} from {{project_name}}")
+
+        result = transformer.command(command)
+
+        assert result.prompt == "{{project_name}} from my-project"
+
+    def test_should_use_variables_given_at_construction_when_caller_changes_them_later(
+        self, sample_placeholders: dict[str, str], sample_project: Project
+    ) -> None:
+        variables = {"language": "python"}
+        transformer = PlaceholderTransformer(
+            placeholders=sample_placeholders, variables=variables, project=sample_project
+        )
+        variables["language"] = "ruby"
+        replacements = {
+            "install_command": ChoiceReplacement(
+                discriminator="language", options={"python": "pip install", "ruby": "gem install"}
+            )
+        }
+        command = Command(
+            name="test", description="test", prompt="{{var:language}}: {{install_command}}", replacements=replacements
+        )
+
+        result = transformer.command(command)
+
+        assert result.prompt == "python: pip install"
+
+    def test_should_expose_read_only_values_when_transformer_is_created(
+        self, transformer: PlaceholderTransformer
+    ) -> None:
+        with pytest.raises(AttributeError):
+            transformer.variables = {}  # type: ignore[misc]
+        with pytest.raises(TypeError):
+            transformer.variables["language"] = "ruby"  # type: ignore[index]
+
+        assert transformer.variables["language"] == "python"
+
 
 class TestEnvironmentVariablePlaceholders:
     def test_should_replace_environment_variable_when_it_exists(
@@ -279,6 +352,104 @@ class TestEnvironmentVariablePlaceholders:
 
         assert result.prompt == "Value: test_value"
 
+    def test_should_replace_every_occurrence_when_environment_variable_repeats(
+        self, transformer: PlaceholderTransformer, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setenv("REPEATED", "value")
+        command = Command(name="test", description="test", prompt="{{env:REPEATED}}/{{env:REPEATED}}")
+
+        result = transformer.command(command)
+
+        assert result.prompt == "value/value"
+
+    def test_should_not_expand_placeholders_inside_environment_values_when_replacing(
+        self, transformer: PlaceholderTransformer, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setenv("FIRST", "{{env:SECOND}}")
+        monkeypatch.setenv("SECOND", "second")
+        command = Command(name="test", description="test", prompt="{{env:FIRST}} {{env:SECOND}}")
+
+        result = transformer.command(command)
+
+        assert result.prompt == "{{env:SECOND}} second"
+
+    def test_should_reuse_environment_value_when_variable_is_referenced_again(
+        self, transformer: PlaceholderTransformer, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setenv("CHANGING", "first")
+        first = transformer.command(Command(name="a", description="a", prompt="{{project_name}}: {{env:CHANGING}}"))
+        monkeypatch.setenv("CHANGING", "second")
+        second = transformer.command(Command(name="b", description="b", prompt="Again: {{env:CHANGING}}"))
+
+        assert first.prompt == "my-project: first"
+        assert second.prompt == "Again: first"
+
+    def test_should_read_environment_per_transformer_when_variable_changes_between_runs(
+        self, sample_placeholders: dict[str, str], sample_project: Project, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        command = Command(name="test", description="test", prompt="{{env:CHANGING}}")
+
+        monkeypatch.setenv("CHANGING", "first")
+        first = PlaceholderTransformer(sample_placeholders, {}, sample_project).command(command)
+        monkeypatch.setenv("CHANGING", "second")
+        second = PlaceholderTransformer(sample_placeholders, {}, sample_project).command(command)
+
+        assert first.prompt == "first"
+        assert second.prompt == "second"
+
+    def test_should_expand_environment_placeholder_when_it_comes_from_a_variable(
+        self, sample_placeholders: dict[str, str], sample_project: Project, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setenv("TOKEN", "secret")
+        transformer = PlaceholderTransformer(
+            placeholders=sample_placeholders, variables={"token": "{{env:TOKEN}}"}, project=sample_project
+        )
+        command = Command(name="test", description="test", prompt="Token: {{var:token}}")
+
+        result = transformer.command(command)
+
+        assert result.prompt == "Token: secret"
+
+    def test_should_read_environment_variable_from_dotenv_file_when_it_is_not_set(
+        self, sample_placeholders: dict[str, str], tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.delenv("CHARLIE_DOTENV_ONLY", raising=False)
+        monkeypatch.setenv("CHARLIE_DOTENV_SHARED", "system")
+        (tmp_path / ".env").write_text("CHARLIE_DOTENV_ONLY=from-file\nCHARLIE_DOTENV_SHARED=file\n")
+        project = Project(name="test-project", namespace=None, dir=str(tmp_path))
+        transformer = PlaceholderTransformer(placeholders=sample_placeholders, variables={}, project=project)
+        command = Command(
+            name="test", description="test", prompt="{{env:CHARLIE_DOTENV_ONLY}} {{env:CHARLIE_DOTENV_SHARED}}"
+        )
+
+        try:
+            result = transformer.command(command)
+        finally:
+            os.environ.pop("CHARLIE_DOTENV_ONLY", None)
+
+        assert result.prompt == "from-file system"
+
+    def test_should_not_read_dotenv_file_when_text_has_no_environment_placeholder(
+        self, sample_placeholders: dict[str, str], tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.delenv("CHARLIE_DOTENV_ONLY", raising=False)
+        (tmp_path / ".env").write_text("CHARLIE_DOTENV_ONLY=from-file\n")
+        project = Project(name="test-project", namespace=None, dir=str(tmp_path))
+        transformer = PlaceholderTransformer(placeholders=sample_placeholders, variables={}, project=project)
+
+        transformer.command(Command(name="test", description="test", prompt="{{project_name}}"))
+
+        assert "CHARLIE_DOTENV_ONLY" not in os.environ
+
+    def test_should_keep_invalid_environment_placeholder_when_name_is_not_an_identifier(
+        self, transformer: PlaceholderTransformer
+    ) -> None:
+        command = Command(name="test", description="test", prompt="Value: {{env:1INVALID}}")
+
+        result = transformer.command(command)
+
+        assert result.prompt == "Value: {{env:1INVALID}}"
+
 
 class TestReplacements:
     def test_should_replace_with_value_when_replacement_type_is_value(
@@ -376,6 +547,23 @@ class TestCommandTransformation:
         assert result.name == "deploy"
         assert result.description == "Deploy application"
 
+    def test_should_leave_original_command_untouched_when_transforming(
+        self, transformer: PlaceholderTransformer
+    ) -> None:
+        command = Command(
+            name="deploy",
+            description="Deploy",
+            prompt="Deploy {{project_name}}",
+            metadata={"target": "{{project_name}}"},
+        )
+
+        result = transformer.command(command)
+
+        assert result.prompt == "Deploy my-project"
+        assert result.metadata == {"target": "my-project"}
+        assert command.prompt == "Deploy {{project_name}}"
+        assert command.metadata == {"target": "{{project_name}}"}
+
     def test_should_preserve_command_metadata_when_transforming(self, transformer: PlaceholderTransformer) -> None:
         metadata = {"category": "build", "priority": 1}
         command = Command(name="build", description="Build project", prompt="Build {{project_name}}", metadata=metadata)
@@ -611,3 +611,20 @@ def test_should_raise_error_for_duplicate_subagent_names() -> None:
                 Subagent(name="reviewer", description="Second", prompt="Second"),
             ],
         )
+
+
+def test_should_report_only_repeated_names_when_subagent_names_are_duplicated() -> None:
+    from pydantic import ValidationError
+
+    from charlie.schema import CharlieConfig
+
+    with pytest.raises(ValidationError, match=r"Duplicate subagent names found: \{'reviewer'\}"):
+        CharlieConfig(
+            project=Project(name="test", namespace=None, dir="."),
+            subagents=[
+                Subagent(name="reviewer", description="First", prompt="First"),
+                Subagent(name="writer", description="Writer", prompt="Writer"),
+                Subagent(name="reviewer", description="Second", prompt="Second"),
+                Subagent(name="reviewer", description="Third", prompt="Third"),
+            ],
+        )
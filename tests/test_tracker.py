@@ -0,0 +1,44 @@
+import pytest
+
+from charlie.tracker import Tracker
+
+
+def test_should_record_event_with_metadata_when_tracking() -> None:
+    tracker = Tracker()
+
+    tracker.track("Created file", {"path": "a.md"})
+
+    assert tracker.records == ({"path": "a.md", "event": "Created file"},)
+
+
+def test_should_return_same_snapshot_when_nothing_was_tracked_since_last_read() -> None:
+    tracker = Tracker()
+    tracker.track("First")
+
+    assert tracker.records is tracker.records
+
+
+def test_should_include_new_events_when_tracking_after_reading_records() -> None:
+    tracker = Tracker()
+    tracker.track("First")
+    snapshot = tracker.records
+
+    tracker.track("Second")
+
+    assert snapshot == ({"event": "First"},)
+    assert tracker.records == ({"event": "First"}, {"event": "Second"})
+
+
+def test_should_keep_event_name_when_metadata_has_event_key() -> None:
+    tracker = Tracker()
+
+    tracker.track("Created file", {"event": "ignored"})
+
+    assert tracker.records == ({"event": "Created file"},)
+
+
+def test_should_reject_unknown_attributes_when_assigning_on_tracker() -> None:
+    tracker = Tracker()
+
+    with pytest.raises(AttributeError):
+        tracker.unknown = "value"  # type: ignore[attr-defined]
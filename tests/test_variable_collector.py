@@ -0,0 +1,58 @@
+import pytest
+
+from charlie.schema import VariableSpec
+from charlie.variable_collector import VariableCollector
+
+
+@pytest.fixture
+def collector() -> VariableCollector:
+    return VariableCollector()
+
+
+def test_should_use_environment_value_when_variable_is_set(
+    collector: VariableCollector, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("CHARLIE_LANGUAGE", "python")
+
+    collected = collector.collect({"language": VariableSpec(env="CHARLIE_LANGUAGE", default="go")})
+
+    assert collected == {"language": "python"}
+
+
+def test_should_use_default_when_environment_variable_is_missing(
+    collector: VariableCollector, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.delenv("CHARLIE_LANGUAGE", raising=False)
+
+    collected = collector.collect({"language": VariableSpec(env="CHARLIE_LANGUAGE", default="go")})
+
+    assert collected == {"language": "go"}
+
+
+def test_should_prompt_with_choices_when_no_value_is_available(
+    collector: VariableCollector, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    prompts: list[str] = []
+    monkeypatch.setattr("builtins.input", lambda prompt: prompts.append(prompt) or "go")
+
+    collected = collector.collect({"language": VariableSpec(choices=["python", "go"])})
+
+    assert collected == {"language": "go"}
+    assert prompts == ["Enter value for language (choices: python, go): "]
+
+
+def test_should_raise_error_when_value_is_not_one_of_the_choices(collector: VariableCollector) -> None:
+    with pytest.raises(ValueError, match="Invalid choice: rust"):
+        collector.collect({"language": VariableSpec(default="rust", choices=["python", "go"])})
+
+
+def test_should_prompt_without_choices_when_variable_has_no_definition(
+    collector: VariableCollector, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    prompts: list[str] = []
+    monkeypatch.setattr("builtins.input", lambda prompt: prompts.append(prompt) or "value")
+
+    collected = collector.collect({"token": None})
+
+    assert collected == {"token": "value"}
+    assert prompts == ["Enter value for token: "]